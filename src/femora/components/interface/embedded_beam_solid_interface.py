@@ -31,6 +31,7 @@ class _SolidSearchContext:
     centers: np.ndarray
     search_radii: np.ndarray
     tree: cKDTree
+    cell_mask: np.ndarray | None = None
 
 
 class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
@@ -81,19 +82,6 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
         mesh = getattr(meshpart, "mesh", None)
         return mesh is not None and np.any(mesh.celltypes == pv.CellType.LINE)
 
-    @staticmethod
-    def _extract_surface_compat(mesh: pv.DataSet) -> pv.PolyData:
-        """Return a surface mesh across PyVista versions.
-
-        Newer PyVista versions support the ``algorithm`` keyword, while older
-        versions raise ``TypeError`` for it. This helper keeps current behavior
-        explicit when supported and falls back cleanly otherwise.
-        """
-        try:
-            return mesh.extract_surface(algorithm="dataset_surface")
-        except TypeError:
-            return mesh.extract_surface()
-
     @staticmethod
     def _find_line_path_endpoints(
         mesh: pv.UnstructuredGrid,
@@ -358,8 +346,36 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
         selected_tags = np.asarray([part.tag for part in self.solid_parts], dtype=meshpart_tags.dtype)
         return solid_mask & np.isin(meshpart_tags, selected_tags)
 
+    def _meshpart_cell_ids(self, mesh: pv.UnstructuredGrid, tag: int) -> np.ndarray:
+        """Return the ascending cell ids of ``mesh`` tagged with meshpart ``tag``.
+
+        Tags are sorted once per assembled mesh and shared through the owning
+        manager, so each lookup is a binary search instead of a full scan.
+        """
+        cached = self._owner._meshpart_cell_index if self._owner is not None else None
+        if cached is None or cached[0] is not mesh:
+            tags = np.asarray(mesh.cell_data["MeshPartTag_celldata"])
+            order = np.argsort(tags, kind="stable")
+            cached = (mesh, order, tags[order])
+            if self._owner is not None:
+                self._owner._meshpart_cell_index = cached
+        _, order, sorted_tags = cached
+        start = np.searchsorted(sorted_tags, tag, side="left")
+        end = np.searchsorted(sorted_tags, tag, side="right")
+        return order[start:end]
+
     def _build_selected_solid_search_context(self, mesh: pv.UnstructuredGrid) -> _SolidSearchContext:
-        """Build a spatial index for only the relevant solid cells."""
+        """Build a spatial index for only the relevant solid cells.
+
+        The index is shared through the owning manager by every interface
+        that selects the same solid parts on the same assembled mesh.
+        """
+        cache_key = None if self.solid_parts is None else tuple(sorted(part.tag for part in self.solid_parts))
+        cache = self._owner._solid_search_contexts if self._owner is not None else {}
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] is mesh:
+            return cached[1]
+
         mask = self._solid_part_cell_mask(mesh)
         selected_cell_ids = np.where(mask)[0].astype(int)
         if selected_cell_ids.size == 0:
@@ -375,6 +391,8 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
         subset = mesh.extract_cells(selected_cell_ids, progress_bar=False)
         context = self._build_solid_search_context(subset)
         context.cell_ids = selected_cell_ids[context.cell_ids]
+        context.cell_mask = mask
+        cache[cache_key] = (mesh, context)
         return context
 
     @staticmethod
@@ -464,20 +482,32 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
         center_distance_to_segment = np.linalg.norm(centers - closest_points, axis=1)
 
         closest_s = s0 + (closest_axial / length) * (s1 - s0)
-        section_points = self._base_section_points()
-        envelope_radius = np.asarray(
-            [
-                self._section_search_radius(section_points, scale)
-                for scale in self._scale_at_path_coordinate(closest_s)
-            ],
-            dtype=float,
-        )
+        unit_radius = self._section_search_radius(self._base_section_points(), 1.0)
+        envelope_radius = unit_radius * self._scale_at_path_coordinate(closest_s)
         cell_margin = self.selection_margin * context.search_radii[candidate_local_ids]
         axial_overlap = (axial >= -cell_margin) & (axial <= length + cell_margin)
         radial_overlap = center_distance_to_segment <= envelope_radius + cell_margin
         selected = axial_overlap & radial_overlap
         return context.cell_ids[candidate_local_ids[selected]]
 
+    @staticmethod
+    def _points_inside_solid(solid_mesh: pv.UnstructuredGrid, points: np.ndarray) -> np.ndarray:
+        """Return mask for ``points`` located inside any cell of ``solid_mesh``.
+
+        Points outside the solid bounding box are rejected first; the rest are
+        located with the mesh's static cell locator.
+        """
+        inside = np.zeros(points.shape[0], dtype=bool)
+        if solid_mesh.n_cells == 0 or points.shape[0] == 0:
+            return inside
+        bounds = np.asarray(solid_mesh.bounds, dtype=float)
+        lower, upper = bounds[0::2], bounds[1::2]
+        tol = 1e-8 * max(float(np.max(upper - lower)), 1.0)
+        candidates = np.where(np.all((points >= lower - tol) & (points <= upper + tol), axis=1))[0]
+        if candidates.size:
+            inside[candidates] = np.atleast_1d(solid_mesh.find_containing_cell(points[candidates])) >= 0
+        return inside
+
     def _find_nearby_cells_for_line_path(
         self,
         assembled_mesh: pv.UnstructuredGrid,
@@ -539,8 +569,7 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
         if selected.size == 0:
             return selected, ordered_segments
 
-        allowed_mask = self._solid_part_cell_mask(assembled_mesh)
-        selected = selected[allowed_mask[selected]]
+        selected = selected[search_context.cell_mask[selected]]
         return selected, ordered_segments
 
     def __init__(
@@ -845,76 +874,62 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
             beam_cells_idx: Array of cell indices for the connected beam path.
 
         Raises:
-            ValueError: If no beams or solids are found during implicit distance calculations.
+            ValueError: If a solid component along the beam path contains no beam points.
             RuntimeError: If this interface is not managed by InterfaceManager.
         """
-        # t_start_total = time.time()
-        # Work on a local copy so discovery can safely annotate/extract meshes.
-        # The real assembled mesh is updated only after all embedded interfaces
-        # have reported their EmbeddedInfo records and conflicts are resolved.
-        assembled_mesh = assembled_mesh.copy()
-        beam_core_array = assembled_mesh.cell_data["Core"][beam_cells_idx]
-        unique_cores = np.unique(beam_core_array)
-        # sort the unique cores from smallest to largest
-        unique_cores = np.sort(unique_cores)
-        target_core = int(unique_cores[0])
-
+        # Discovery only reads the assembled mesh; annotations go on extracted
+        # sub-meshes. The real Core array is updated only after all embedded
+        # interfaces have reported their EmbeddedInfo records.
+        target_core = int(np.min(assembled_mesh.cell_data["Core"][beam_cells_idx]))
 
         nearby_cell_ids, ordered_segments = self._find_nearby_cells_for_line_path(
             assembled_mesh,
             beam_cells_idx,
         )
 
-                
-
-        # t_start_section = time.time()
         inner_cell_ids = np.unique(
             np.concatenate((nearby_cell_ids, np.asarray(beam_cells_idx, dtype=int)))
-        )
-        inner = assembled_mesh.extract_cells(
-            inner_cell_ids,
-            progress_bar=False
-        )
-        # print(f"--- Time for inner mesh extraction: {time.time() - t_start_section:.4f}s")
-
-
-
-        beam_elements = inner.celltypes == pv.CellType.LINE
-        solid_elements = self._solid_part_cell_mask(inner)
-        beam_ind = inner.cell_data["vtkOriginalCellIds"][beam_elements]
-        solid_ind = inner.cell_data["vtkOriginalCellIds"][solid_elements]
-
-
-        # save the assembeled mesh indexes to the inner mesh
-        inner.cell_data["mesh_ind"] = np.zeros(inner.n_cells, dtype=np.int32)
-        inner.cell_data["mesh_ind"][solid_elements] = solid_ind
-        inner.cell_data["mesh_ind"][beam_elements] = beam_ind
-
+        ).astype(np.int32)
+
+        # Split the neighbourhood into beams and selected solids with the
+        # assembled-mesh masks and extract each directly, without building
+        # the combined inner grid first.
+        solid_mask = self._build_selected_solid_search_context(assembled_mesh).cell_mask
+        beam_ind = inner_cell_ids[assembled_mesh.celltypes[inner_cell_ids] == pv.CellType.LINE]
+        solid_ind = inner_cell_ids[solid_mask[inner_cell_ids]]
+        solid_mesh = assembled_mesh.extract_cells(solid_ind, progress_bar=False)
+        beam_mesh = assembled_mesh.extract_cells(beam_ind, progress_bar=False)
+
+        # save the assembled mesh indexes on the extracted meshes
+        for part in (solid_mesh, beam_mesh):
+            if part.n_cells > 0:
+                part.cell_data["mesh_ind"] = np.asarray(
+                    part.cell_data["vtkOriginalCellIds"], dtype=np.int32
+                )
 
-        # Do a for loop and in every iteration pop up the largest solid mesh from the inner mesh
-        solid_mesh = inner.extract_cells(solid_elements, progress_bar=False)
-        beam_mesh  = inner.extract_cells(beam_elements, progress_bar=False)
+        # Label the connected solid components once and pair each with the beams inside it
         beams_solids = []
-        # t_start_loop = time.time()
-        while solid_mesh.n_cells > 0:
-            solid_mesh_largest = solid_mesh.extract_largest()
-            surf = self._extract_surface_compat(solid_mesh_largest)
-            beam_mesh.compute_implicit_distance(surf,inplace=True)
-            beams = beam_mesh.point_data["implicit_distance"] <= 0
+        if solid_mesh.n_cells > 0:
+            solid_mesh = solid_mesh.connectivity(extraction_mode="all")
+            region_ids = np.asarray(solid_mesh.cell_data["RegionId"])
+            # Bucket cells by region once instead of masking the whole grid per component.
+            order = np.argsort(region_ids, kind="stable")
+            _, region_starts = np.unique(region_ids[order], return_index=True)
+            components = np.split(order, region_starts[1:])
+        else:
+            components = []
+        for component_cells in components:
+            solid_component = solid_mesh.extract_cells(component_cells, progress_bar=False)
+            beams = self._points_inside_solid(solid_component, beam_mesh.points)
             beams = beam_mesh.extract_points(beams, include_cells=True, adjacent_cells=True, progress_bar=False)
 
             if beams.n_cells < 1:
-                if solid_mesh_largest.n_cells < 1:
+                if solid_component.n_cells < 1:
                     raise ValueError("No beams and solids found in the solid mesh.")
                 else:
-                    # # plot for debugging
-                    # pl = pv.Plotter()
-                    # pl.add_mesh(solid_mesh_largest, color="blue", opacity=0.5, show_edges=True)
-                    # pl.add_mesh(beam_mesh, color="red", opacity=1.0, line_width=5)
-                    # pl.show()
                     intersects_path = False
                     for _, point_a, point_b, _, _ in ordered_segments:
-                        ind = solid_mesh_largest.find_cells_intersecting_line(
+                        ind = solid_component.find_cells_intersecting_line(
                             assembled_mesh.points[point_a],
                             assembled_mesh.points[point_b],
                             tolerance=0,
@@ -929,30 +944,18 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
                         probably the beam mesh size is too small. \
                         please increase the number of points in the beam mesh.")
             else:
-                if solid_mesh_largest.n_cells < 1:
+                if solid_component.n_cells < 1:
                     raise ValueError("No solids found in the solid mesh, but beams are present. This is unexpected. contact the developers.")
-                
 
-            if beams.n_cells > 0 and solid_mesh_largest.n_cells > 0:
+            if beams.n_cells > 0 and solid_component.n_cells > 0:
                 beams = beams.cell_data["mesh_ind"]
-                solids = solid_mesh_largest.cell_data["mesh_ind"]
+                solids = solid_component.cell_data["mesh_ind"]
 
                 if len(beams) > 0 and len(solids) > 0:
                     beams_solids.append((beams, solids))
 
-            # now remove the largset solid mesh from the solid_mesh
-            solid_mesh = solid_mesh.extract_values(solid_mesh_largest.cell_data["mesh_ind"] , invert=True, scalars="mesh_ind")
-        # print(f"--- Time for while loop: {time.time() - t_start_loop:.4f}s")
-      
-        
-        
-        # print("num cells:", assembled_mesh.n_cells)
-        # print("num points:", assembled_mesh.n_points)
-
-
         if len(beams_solids) == 0:
             return
-        
 
         ef = EmbeddedInfo(beams=beam_ind,
                      core_number= target_core,
@@ -965,9 +968,6 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
         self._owner._embeddedinfo_list.append(ef)
         self._instance_embeddedinfo_list.append(ef)
 
-
-        # print(f"--- Total time for _collect_embedded_info_for_beam_path: {time.time() - t_start_total:.4f}s")
-
     def _on_post_assemble(self, assembled_mesh: pv.UnstructuredGrid, **kwargs):
         """Post-assemble event listener to map core partitions between beams and solids.
 
@@ -980,7 +980,7 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
             TypeError: If `beam_part` is of an invalid mesh type.
         """
         # Collect beam cells indices & compute their mean location
-        beam_cells_idx = np.where(assembled_mesh.cell_data["MeshPartTag_celldata"] == self.beam_part.tag)[0]
+        beam_cells_idx = self._meshpart_cell_ids(assembled_mesh, self.beam_part.tag)
         if beam_cells_idx.size == 0:
             raise ValueError("No beam elements found in assembled mesh for provided MeshPart")
         
@@ -1046,12 +1046,11 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
             project_beam.merge_points(tolerance=1e-3, inplace=True)
             normal = np.array([norm_x, norm_y, norm_z])
             normal = normal / np.linalg.norm(normal)  # Normalize the normal vector
-            beamindxes = np.where(assembled_mesh.cell_data["MeshPartTag_celldata"] == self.beam_part.tag)[0]
             for projected_point in project_beam.points:
                 point_a = projected_point - 1.1 * normal * length / 2 # 1.1 to make sure the line is longer than the mesh
                 point_b = projected_point + 1.1 * normal * length / 2 # 1.1 to make sure the line is longer than the mesh
                 indxes = assembled_mesh.find_cells_along_line(point_a, point_b, tolerance=1e-3)
-                indxes = np.intersect1d(indxes, beamindxes, assume_unique=True)  # Only keep beam indices
+                indxes = np.intersect1d(indxes, beam_cells_idx, assume_unique=True)  # Only keep beam indices
                 if indxes.shape[0] == 0:
                     raise ValueError(
                         f"No beam elements found in assembled mesh for projected point {projected_point}."
@@ -1092,7 +1091,6 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
         Raises:
             RuntimeError: If the interface is not registered in the manager.
         """
-        # print(f"[EmbeddedBeamSolidInterface:{self.name}] Exporting TCL commands.")
         if self._owner is None:
             raise RuntimeError(
                 f"EmbeddedBeamSolidInterface '{self.name}' must be managed by InterfaceManager "
@@ -1206,6 +1204,8 @@ class EmbeddedBeamSolidInterface(InterfaceBase, HandlesDecompositionMixin):
                 "before pre-assemble handling"
             )
         self._owner._embeddedinfo_list.clear()
+        self._owner._solid_search_contexts.clear()
+        self._owner._meshpart_cell_index = None
         self._instance_embeddedinfo_list.clear()
 
 
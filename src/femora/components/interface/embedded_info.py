@@ -125,7 +125,7 @@ class EmbeddedInfo:
             return False
         
         # Check if any list1 hash overlaps
-        return bool(self._list1_hashes & other._list1_hashes)
+        return not self._list1_hashes.isdisjoint(other._list1_hashes)
     
     def is_similar(self, other: 'EmbeddedInfo') -> bool:
         """Check if two objects are similar (share identical beams or solids without conflict).
@@ -148,7 +148,7 @@ class EmbeddedInfo:
             return True
 
         # New similarity â€“ overlapping solids
-        return bool(self._solids_set & other._solids_set)
+        return not self._solids_set.isdisjoint(other._solids_set)
     
     def __hash__(self) -> int:
         """Compute the hash using pre-computed canonical values."""
@@ -176,13 +176,14 @@ class EmbeddedInfo:
         
         # Check conflict first (only possible with same beams)
         if self.beams == other.beams:
-            if self._list1_hashes & other._list1_hashes:
+            if not self._list1_hashes.isdisjoint(other._list1_hashes):
                 return "conflict"
             # Equal already handled; so same beams, no conflict
             return "similar"
 
         # Different beams â€“ decide similarity by solid overlap
-        if self._solids_set & other._solids_set:
+        # isdisjoint stops at the first shared id and builds no intersection set
+        if not self._solids_set.isdisjoint(other._solids_set):
             return "similar"
 
         return "unrelated"
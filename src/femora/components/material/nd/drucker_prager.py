@@ -51,6 +51,28 @@ class DruckerPragerMaterial(Material):
         ```
     """
 
+    __slots__ = ()
+
+    material_type = "nDMaterial"
+    material_name = "DruckerPrager"
+    _tcl_prefix = f"{material_type} {material_name}"
+
+    _PARAMETERS = (
+        "k",
+        "G",
+        "sigmaY",
+        "rho",
+        "rhoBar",
+        "Kinf",
+        "Ko",
+        "delta1",
+        "delta2",
+        "H",
+        "theta",
+        "density",
+        "atmPressure",
+    )
+
     __doc_controls__ = {
         "show_docstring_attributes": True,
         "members": ["__init__"],
@@ -199,7 +221,7 @@ class DruckerPragerMaterial(Material):
                 raise ValueError(spec["message"])
             validated[param] = vf
 
-        super().__init__("nDMaterial", "DruckerPrager", user_name)
+        super().__init__(user_name=user_name)
         self.params = validated
 
     def to_tcl(self) -> str:
@@ -213,27 +235,7 @@ class DruckerPragerMaterial(Material):
         Raises:
             ValueError: If the material lacks a manager-assigned tag.
         """
-        order = [
-            "k",
-            "G",
-            "sigmaY",
-            "rho",
-            "rhoBar",
-            "Kinf",
-            "Ko",
-            "delta1",
-            "delta2",
-            "H",
-            "theta",
-            "density",
-            "atmPressure",
-        ]
-        p = self.params
-        params_str = " ".join(str(p[k]) for k in order)
-        return (
-            f"{self.material_type} DruckerPrager "
-            f"{self._require_tag()} {params_str}; # {self.user_name}"
-        )
+        return self._params_tcl_command()
 
 
 __all__ = ["DruckerPragerMaterial"]
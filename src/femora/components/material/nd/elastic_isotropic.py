@@ -49,6 +49,14 @@ class ElasticIsotropicMaterial(Material):
         ```
     """
 
+    __slots__ = ()
+
+    material_type = "nDMaterial"
+    material_name = "ElasticIsotropic"
+    _tcl_prefix = f"{material_type} {material_name}"
+
+    _PARAMETERS = ("E", "nu", "rho")
+
     __doc_controls__ = {
         "show_docstring_attributes": True,
         "members": ["__init__"],
@@ -110,7 +118,7 @@ class ElasticIsotropicMaterial(Material):
         if rhof < 0:
             raise ValueError("Density 'rho' must be non-negative.")
 
-        super().__init__("nDMaterial", "ElasticIsotropic", user_name)
+        super().__init__(user_name=user_name)
         self.params: Dict[str, float] = {"E": Ef, "nu": nuf, "rho": rhof}
 
     def to_tcl(self) -> str:
@@ -123,11 +131,7 @@ class ElasticIsotropicMaterial(Material):
         Raises:
             ValueError: If this instance has no manager-assigned tag yet.
         """
-        p = self.params
-        return (
-            f"{self.material_type} ElasticIsotropic "
-            f"{self._require_tag()} {p['E']} {p['nu']} {p['rho']}; # {self.user_name}"
-        )
+        return self._params_tcl_command()
 
 
 __all__ = ["ElasticIsotropicMaterial"]
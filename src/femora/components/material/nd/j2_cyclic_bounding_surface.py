@@ -58,6 +58,14 @@ class J2CyclicBoundingSurfaceMaterial(Material):
         ```
     """
 
+    __slots__ = ()
+
+    material_type = "nDMaterial"
+    material_name = "J2CyclicBoundingSurface"
+    _tcl_prefix = f"{material_type} {material_name}"
+
+    _PARAMETERS = ("G", "K", "Su", "Den", "h", "m", "h0", "chi", "beta")
+
     __doc_controls__ = {
         "show_docstring_attributes": True,
         "members": ["__init__"],
@@ -137,7 +145,7 @@ class J2CyclicBoundingSurfaceMaterial(Material):
             raise ValueError("Integration variable 'beta' must be in range [0, 1].")
         out["beta"] = betaf
 
-        super().__init__("nDMaterial", "J2CyclicBoundingSurface", user_name)
+        super().__init__(user_name=user_name)
         self.params = out
 
     def to_tcl(self) -> str:
@@ -150,13 +158,7 @@ class J2CyclicBoundingSurfaceMaterial(Material):
         Raises:
             ValueError: If the material is unmanaged.
         """
-        p = self.params
-        keys = ["G", "K", "Su", "Den", "h", "m", "h0", "chi", "beta"]
-        params_str = " ".join(str(p[k]) for k in keys)
-        return (
-            f"{self.material_type} J2CyclicBoundingSurface "
-            f"{self._require_tag()} {params_str}; # {self.user_name}"
-        )
+        return self._params_tcl_command()
 
     def updateMaterialStage(self, state: str) -> str:
         """Emit Tcl to switch elastic versus plastic modulus stages.
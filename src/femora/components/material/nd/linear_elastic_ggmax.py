@@ -50,6 +50,12 @@ class LinearElasticGGmaxMaterial(Material):
         ```
     """
 
+    __slots__ = ()
+
+    material_type = "nDMaterial"
+    material_name = "LinearElasticGGmax"
+    _tcl_prefix = f"{material_type} {material_name}"
+
     __doc_controls__ = {
         "show_docstring_attributes": True,
         "members": ["__init__"],
@@ -143,7 +149,7 @@ class LinearElasticGGmaxMaterial(Material):
             out["param2"] = float(param2) if param2 is not None else 100.0
             out["param3"] = float(param3) if param3 is not None else 1.0
 
-        super().__init__("nDMaterial", "LinearElasticGGmax", user_name)
+        super().__init__(user_name=user_name)
         self.params = out
 
     def to_tcl(self) -> str:
@@ -159,8 +165,7 @@ class LinearElasticGGmaxMaterial(Material):
         """
         p = self.params
         parts: List[str] = [
-            self.material_type,
-            "LinearElasticGGmax",
+            self._tcl_prefix,
             str(self._require_tag()),
             str(p["G"]),
             str(p["K_or_nu"]),
@@ -62,6 +62,12 @@ class PressureDependMultiYieldMaterial(Material):
         ```
     """
 
+    __slots__ = ()
+
+    material_type = "nDMaterial"
+    material_name = "PressureDependMultiYield"
+    _tcl_prefix = f"{material_type} {material_name}"
+
     __doc_controls__ = {
         "show_docstring_attributes": True,
         "members": ["__init__"],
@@ -101,7 +107,7 @@ class PressureDependMultiYieldMaterial(Material):
             ValueError: If a numeric Tcl argument cannot be converted correctly.
             ValueError: If any validated value falls outside the supported range.
         """
-        super().__init__("nDMaterial", "PressureDependMultiYield", user_name)
+        super().__init__(user_name=user_name)
         validated: Dict[str, Any] = {}
 
         required = [
@@ -227,8 +233,7 @@ class PressureDependMultiYieldMaterial(Material):
         """
         p = self.params
         parts = [
-            self.material_type,
-            "PressureDependMultiYield",
+            self._tcl_prefix,
             str(self._require_tag()),
             str(int(p["nd"])),
             str(p["rho"]),
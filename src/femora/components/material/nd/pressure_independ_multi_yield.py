@@ -54,6 +54,12 @@ class PressureIndependMultiYieldMaterial(Material):
         ```
     """
 
+    __slots__ = ()
+
+    material_type = "nDMaterial"
+    material_name = "PressureIndependMultiYield"
+    _tcl_prefix = f"{material_type} {material_name}"
+
     __doc_controls__ = {
         "show_docstring_attributes": True,
         "members": ["__init__"],
@@ -82,7 +88,7 @@ class PressureIndependMultiYieldMaterial(Material):
             ValueError: If any validated value falls outside the supported range.
             ValueError: If ``pairs`` is malformed or invalid when required.
         """
-        super().__init__("nDMaterial", "PressureIndependMultiYield", user_name)
+        super().__init__(user_name=user_name)
         validated: Dict[str, Any] = {}
 
         required = [
@@ -179,8 +185,7 @@ class PressureIndependMultiYieldMaterial(Material):
         """
         p = self.params
         parts = [
-            self.material_type,
-            "PressureIndependMultiYield",
+            self._tcl_prefix,
             str(self._require_tag()),
             str(int(p["nd"])),
             str(p["rho"]),
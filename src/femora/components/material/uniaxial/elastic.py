@@ -48,6 +48,14 @@ class ElasticUniaxialMaterial(Material):
         ```
     """
 
+    __slots__ = ()
+
+    material_type = "uniaxialMaterial"
+    material_name = "Elastic"
+    _tcl_prefix = f"{material_type} {material_name}"
+
+    _PARAMETERS = ("E", "eta", "Eneg")
+
     __doc_controls__ = {
         "show_docstring_attributes": True,
         "members": ["__init__"],
@@ -108,7 +116,7 @@ class ElasticUniaxialMaterial(Material):
             if Enegf <= 0:
                 raise ValueError("Negative elastic modulus 'Eneg' must be positive.")
 
-        super().__init__("uniaxialMaterial", "Elastic", user_name)
+        super().__init__(user_name=user_name)
         self.params: Dict[str, float] = {"E": Ef, "eta": etaf, "Eneg": Enegf}
 
     def to_tcl(self) -> str:
@@ -121,11 +129,7 @@ class ElasticUniaxialMaterial(Material):
         Raises:
             ValueError: If the material is unmanaged.
         """
-        p = self.params
-        return (
-            f"{self.material_type} Elastic "
-            f"{self._require_tag()} {p['E']} {p['eta']} {p['Eneg']}; # {self.user_name}"
-        )
+        return self._params_tcl_command()
 
 
 __all__ = ["ElasticUniaxialMaterial"]
@@ -50,6 +50,12 @@ class Steel01Material(Material):
         ```
     """
 
+    __slots__ = ()
+
+    material_type = "uniaxialMaterial"
+    material_name = "Steel01"
+    _tcl_prefix = f"{material_type} {material_name}"
+
     __doc_controls__ = {
         "show_docstring_attributes": True,
         "members": ["__init__"],
@@ -125,7 +131,7 @@ class Steel01Material(Material):
                 raise ValueError(f"'{key}' must be non-negative.")
             params[key] = vf
 
-        super().__init__("uniaxialMaterial", "Steel01", user_name)
+        super().__init__(user_name=user_name)
         self.params = params
 
     def to_tcl(self) -> str:
@@ -138,18 +144,7 @@ class Steel01Material(Material):
         Raises:
             ValueError: If the material has not been registered with a manager.
         """
-        p = self.params
-        parts = [
-            self.material_type,
-            "Steel01",
-            str(self._require_tag()),
-            str(p["Fy"]),
-            str(p["E0"]),
-            str(p["b"]),
-        ]
-        if all(k in p for k in ("a1", "a2", "a3", "a4")):
-            parts.extend([str(p["a1"]), str(p["a2"]), str(p["a3"]), str(p["a4"])])
-        return " ".join(parts) + f"; # {self.user_name}"
+        return self._params_tcl_command()
 
 
 __all__ = ["Steel01Material"]
@@ -108,8 +108,7 @@ class StraightLayer(LayerBase):
             else:
                 y_positions = np.linspace(self.y1, self.y2, self.num_fibers)
                 z_positions = np.linspace(self.z1, self.z2, self.num_fibers)
-                for y_pos, z_pos in zip(y_positions, z_positions):
-                    ax.plot(y_pos, z_pos, "s", color=color, markersize=6, alpha=0.8)
+                ax.plot(y_positions, z_positions, "s", color=color, markersize=6, alpha=0.8)
 
     def validate(self) -> None:
         """Validate the straight layer parameters.
@@ -234,10 +233,9 @@ class CircularLayer(LayerBase):
             ax.plot(y_arc, z_arc, color=color, linewidth=2, alpha=0.8, linestyle="--")
         if show_fibers:
             angles = [np.radians(self.start_ang)] if self.num_fibers == 1 else np.linspace(np.radians(self.start_ang), np.radians(self.end_ang), self.num_fibers)
-            for angle in angles:
-                y_fiber = self.y_center + self.radius * np.cos(angle)
-                z_fiber = self.z_center + self.radius * np.sin(angle)
-                ax.plot(y_fiber, z_fiber, "s", color=color, markersize=6, alpha=0.8)
+            y_fibers = self.y_center + self.radius * np.cos(angles)
+            z_fibers = self.z_center + self.radius * np.sin(angles)
+            ax.plot(y_fibers, z_fibers, "s", color=color, markersize=6, alpha=0.8)
 
     def validate(self) -> None:
         """Validate the circular layer parameters.
@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Polygon, Rectangle, Wedge
 
 from femora.core.material_base import Material
@@ -108,10 +109,16 @@ class RectangularPatch(PatchBase):
         if show_fiber_grid:
             y_edges = np.linspace(self.y1, self.y2, self.num_subdiv_y + 1)
             z_edges = np.linspace(self.z1, self.z2, self.num_subdiv_z + 1)
-            for y in y_edges:
-                ax.plot([y, y], [self.z1, self.z2], color="white", linewidth=0.8, alpha=0.7)
-            for z in z_edges:
-                ax.plot([self.y1, self.y2], [z, z], color="white", linewidth=0.8, alpha=0.7)
+            vertical = np.stack([
+                np.column_stack([y_edges, np.full_like(y_edges, self.z1)]),
+                np.column_stack([y_edges, np.full_like(y_edges, self.z2)]),
+            ], axis=1)
+            horizontal = np.stack([
+                np.column_stack([np.full_like(z_edges, self.y1), z_edges]),
+                np.column_stack([np.full_like(z_edges, self.y2), z_edges]),
+            ], axis=1)
+            ax.add_collection(LineCollection(np.concatenate([vertical, horizontal]),
+                                             colors="white", linewidths=0.8, alpha=0.7))
 
     def validate(self) -> None:
         """Validate the rectangular patch parameters.
@@ -239,10 +246,10 @@ class QuadrilateralPatch(PatchBase):
             edge2z = np.linspace(z_s[1], z_s[2], self.num_subdiv_jk + 1)[1:-1]
             edge3z = np.linspace(z_s[2], z_s[3], self.num_subdiv_ij + 1)[1:-1][::-1]
             edge4z = np.linspace(z_s[3], z_s[0], self.num_subdiv_jk + 1)[1:-1][::-1]
-            for i in range(self.num_subdiv_ij - 1):
-                ax.plot([edge1y[i], edge3y[i]], [edge1z[i], edge3z[i]], color="white", linewidth=0.8, alpha=0.7)
-            for i in range(self.num_subdiv_jk - 1):
-                ax.plot([edge2y[i], edge4y[i]], [edge2z[i], edge4z[i]], color="white", linewidth=0.8, alpha=0.7)
+            starts = np.column_stack([np.concatenate([edge1y, edge2y]), np.concatenate([edge1z, edge2z])])
+            ends = np.column_stack([np.concatenate([edge3y, edge4y]), np.concatenate([edge3z, edge4z])])
+            ax.add_collection(LineCollection(np.stack([starts, ends], axis=1),
+                                             colors="white", linewidths=0.8, alpha=0.7))
 
     def validate(self) -> None:
         """Validate the quadrilateral patch parameters.
@@ -387,13 +394,10 @@ class CircularPatch(PatchBase):
             youter = self.ext_rad * np.cos(angles) + self.y_center
             zouter = self.ext_rad * np.sin(angles) + self.z_center
             if self.is_solid():
-                for i in range(len(angles) - 1):
-                    ax.plot([self.y_center, youter[i]], [self.z_center, zouter[i]], color="white", linewidth=0.5, alpha=0.5)
-                    ax.plot([self.y_center, youter[i + 1]], [self.z_center, zouter[i + 1]], color="white", linewidth=0.5, alpha=0.5)
-            else:
-                for i in range(len(yinner) - 1):
-                    ax.plot([yinner[i], youter[i]], [zinner[i], zouter[i]], color="white", linewidth=0.5, alpha=0.5)
-                    ax.plot([yinner[i + 1], youter[i + 1]], [zinner[i + 1], zouter[i + 1]], color="white", linewidth=0.5, alpha=0.5)
+                yinner = np.full_like(angles, self.y_center)
+                zinner = np.full_like(angles, self.z_center)
+            radial = np.stack([np.column_stack([yinner, zinner]), np.column_stack([youter, zouter])], axis=1)
+            ax.add_collection(LineCollection(radial, colors="white", linewidths=0.5, alpha=0.5))
             for r in np.linspace(self.int_rad, self.ext_rad, self.num_subdiv_rad):
                 if r < 1e-12:
                     continue
@@ -10,11 +10,13 @@
 from __future__ import annotations
 
 import math
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import EllipseCollection
+from matplotlib.colors import to_rgba_array
 
 from femora.core.material_base import Material
 from femora.core.section_base import Section
@@ -28,6 +30,57 @@ from femora.components.section.fiber.patches import (
 )
 
 
+def _rectangular_patch_grid(patch: RectangularPatch) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (area, y, z) arrays for the cell centroids of a rectangular patch."""
+    ny, nz = patch.num_subdiv_y, patch.num_subdiv_z
+    dy = (patch.y2 - patch.y1) / ny
+    dz = (patch.z2 - patch.z1) / nz
+    y = patch.y1 + (np.arange(ny) + 0.5) * dy
+    z = patch.z1 + (np.arange(nz) + 0.5) * dz
+    return np.full(ny * nz, dy * dz), np.repeat(y, nz), np.tile(z, ny)
+
+
+def _quadrilateral_patch_grid(patch: QuadrilateralPatch) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (area, y, z) arrays for the cells of a bilinearly mapped quadrilateral patch."""
+    vertices = np.asarray(patch.vertices, dtype=np.float64)
+    s, t = np.meshgrid(
+        np.arange(patch.num_subdiv_ij + 1) / patch.num_subdiv_ij,
+        np.arange(patch.num_subdiv_jk + 1) / patch.num_subdiv_jk,
+        indexing="ij",
+    )
+    weights = np.stack([(1 - s) * (1 - t), s * (1 - t), s * t, (1 - s) * t], axis=-1)
+    nodes = weights @ vertices
+    # Cell corners in I, J, K, L order, each of shape (ni, nj, 2)
+    corners = [nodes[:-1, :-1], nodes[1:, :-1], nodes[1:, 1:], nodes[:-1, 1:]]
+    twice_area = sum(
+        corners[k][..., 0] * corners[(k + 1) % 4][..., 1]
+        - corners[(k + 1) % 4][..., 0] * corners[k][..., 1]
+        for k in range(4)
+    )
+    centroid = sum(corners) / 4.0
+    return 0.5 * np.abs(twice_area).ravel(), centroid[..., 0].ravel(), centroid[..., 1].ravel()
+
+
+def _circular_patch_grid(patch: CircularPatch) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (area, y, z) arrays for the annular-sector cells of a circular patch."""
+    nr, nc = patch.num_subdiv_rad, patch.num_subdiv_circ
+    theta0 = math.radians(patch.start_ang)
+    theta1 = math.radians(patch.end_ang)
+    if theta1 <= theta0:
+        theta1 += 2 * math.pi
+    dtheta = (theta1 - theta0) / nc
+    radii = patch.int_rad + np.arange(nr + 1) * (patch.ext_rad - patch.int_rad) / nr
+    r_in, r_out = radii[:-1], radii[1:]
+    thin = np.abs(r_out - r_in) < 1e-12
+    denom = np.where(thin, 1.0, r_out**2 - r_in**2)
+    r_cent = np.where(thin, 0.5 * (r_in + r_out), (2.0 / 3.0) * (r_out**3 - r_in**3) / denom)
+    th_cent = theta0 + (np.arange(nc) + 0.5) * dtheta
+    area = np.repeat(0.5 * dtheta * (r_out * r_out - r_in * r_in), nc)
+    y = patch.y_center + np.outer(r_cent, np.cos(th_cent))
+    z = patch.z_center + np.outer(r_cent, np.sin(th_cent))
+    return area, y.ravel(), z.ravel()
+
+
 class FiberSection(Section):
     """General cross-section discretized into a collection of fibers.
 
@@ -372,124 +425,62 @@ class FiberSection(Section):
     def _discretize_to_fibers(self) -> List[tuple]:
         """Convert all high-level components into explicit (area, y, z) points.
 
+        Returns:
+            List of tuples: (area, y, z).
+        """
+        area, y, z = self._discretize_to_arrays()
+        return list(zip(area.tolist(), y.tolist(), z.tolist()))
+
+    def _discretize_to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convert all high-level components into parallel area, y and z arrays.
+
         This method is used internally to calculate aggregate section properties
-        like Area and Inertia.
+        like Area and Inertia. Fibers are ordered as individual fibers, then
+        layers, then patches.
 
         Returns:
-            List of tuples: (area, y, z).
+            Tuple of float arrays: (area, y, z).
         """
-        fibers = []
-        for fiber in self.fibers:
-            fibers.append((fiber.area, fiber.y_loc, fiber.z_loc))
+        parts = []
+        if self.fibers:
+            y, z, area = self._fiber_arrays(self.fibers)
+            parts.append((area, y, z))
 
         for layer in self.layers:
+            if layer.num_fibers <= 0:
+                continue
             if isinstance(layer, StraightLayer):
-                if layer.num_fibers <= 0:
-                    continue
-                ys = [
-                    layer.y1 + (i + 0.5) * (layer.y2 - layer.y1) / layer.num_fibers
-                    for i in range(layer.num_fibers)
-                ]
-                zs = [
-                    layer.z1 + (i + 0.5) * (layer.z2 - layer.z1) / layer.num_fibers
-                    for i in range(layer.num_fibers)
-                ]
-                for y, z in zip(ys, zs):
-                    fibers.append((layer.area_per_fiber, y, z))
+                offsets = (np.arange(layer.num_fibers) + 0.5) / layer.num_fibers
+                y = layer.y1 + offsets * (layer.y2 - layer.y1)
+                z = layer.z1 + offsets * (layer.z2 - layer.z1)
             elif isinstance(layer, CircularLayer):
-                if layer.num_fibers <= 0:
-                    continue
                 if layer.num_fibers == 1:
-                    angles = [math.radians(layer.start_ang)]
+                    angles = np.array([math.radians(layer.start_ang)])
                 else:
-                    angles = list(
-                        np.linspace(
-                            math.radians(layer.start_ang),
-                            math.radians(layer.end_ang),
-                            layer.num_fibers,
-                        ),
+                    angles = np.linspace(
+                        math.radians(layer.start_ang),
+                        math.radians(layer.end_ang),
+                        layer.num_fibers,
                     )
-                for ang in angles:
-                    y = layer.y_center + layer.radius * math.cos(ang)
-                    z = layer.z_center + layer.radius * math.sin(ang)
-                    fibers.append((layer.area_per_fiber, y, z))
+                y = layer.y_center + layer.radius * np.cos(angles)
+                z = layer.z_center + layer.radius * np.sin(angles)
+            else:
+                continue
+            parts.append((np.full(layer.num_fibers, float(layer.area_per_fiber)), y, z))
 
         for patch in self.patches:
             if isinstance(patch, RectangularPatch):
-                ny = patch.num_subdiv_y
-                nz = patch.num_subdiv_z
-                dy = (patch.y2 - patch.y1) / ny
-                dz = (patch.z2 - patch.z1) / nz
-                for i in range(ny):
-                    y = patch.y1 + (i + 0.5) * dy
-                    for j in range(nz):
-                        z = patch.z1 + (j + 0.5) * dz
-                        fibers.append((dy * dz, y, z))
+                parts.append(_rectangular_patch_grid(patch))
             elif isinstance(patch, QuadrilateralPatch):
-                ni = patch.num_subdiv_ij
-                nj = patch.num_subdiv_jk
-                vertices = patch.vertices
-                for i in range(ni):
-                    s0 = i / ni
-                    s1 = (i + 1) / ni
-                    for j in range(nj):
-                        t0 = j / nj
-                        t1 = (j + 1) / nj
-
-                        def bilinear(s: float, t: float) -> Tuple[float, float]:
-                            x = (
-                                (1 - s) * (1 - t) * vertices[0][0]
-                                + s * (1 - t) * vertices[1][0]
-                                + s * t * vertices[2][0]
-                                + (1 - s) * t * vertices[3][0]
-                            )
-                            y = (
-                                (1 - s) * (1 - t) * vertices[0][1]
-                                + s * (1 - t) * vertices[1][1]
-                                + s * t * vertices[2][1]
-                                + (1 - s) * t * vertices[3][1]
-                            )
-                            return x, y
-
-                        c00 = bilinear(s0, t0)
-                        c10 = bilinear(s1, t0)
-                        c11 = bilinear(s1, t1)
-                        c01 = bilinear(s0, t1)
-                        xs = [c00[0], c10[0], c11[0], c01[0]]
-                        ys = [c00[1], c10[1], c11[1], c01[1]]
-                        area = 0.0
-                        for k in range(4):
-                            k1 = (k + 1) % 4
-                            area += xs[k] * ys[k1] - xs[k1] * ys[k]
-                        area = 0.5 * abs(area)
-                        yc = sum(xs) / 4.0
-                        zc = sum(ys) / 4.0
-                        fibers.append((area, yc, zc))
+                parts.append(_quadrilateral_patch_grid(patch))
             elif isinstance(patch, CircularPatch):
-                nr = patch.num_subdiv_rad
-                nc = patch.num_subdiv_circ
-                theta0 = math.radians(patch.start_ang)
-                theta1 = math.radians(patch.end_ang)
-                if theta1 <= theta0:
-                    theta1 += 2 * math.pi
-                dtheta = (theta1 - theta0) / nc
-                for ir in range(nr):
-                    r_in = patch.int_rad + ir * (patch.ext_rad - patch.int_rad) / nr
-                    r_out = patch.int_rad + (ir + 1) * (patch.ext_rad - patch.int_rad) / nr
-                    for ic in range(nc):
-                        th0 = theta0 + ic * dtheta
-                        th1 = theta0 + (ic + 1) * dtheta
-                        area = 0.5 * (th1 - th0) * (r_out * r_out - r_in * r_in)
-                        if abs(r_out - r_in) < 1e-12:
-                            r_cent = 0.5 * (r_in + r_out)
-                        else:
-                            r_cent = (2.0 / 3.0) * (r_out**3 - r_in**3) / (r_out**2 - r_in**2)
-                        th_cent = 0.5 * (th0 + th1)
-                        y = patch.y_center + r_cent * math.cos(th_cent)
-                        z = patch.z_center + r_cent * math.sin(th_cent)
-                        fibers.append((area, y, z))
-
-        return fibers
+                parts.append(_circular_patch_grid(patch))
+
+        if not parts:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty, empty
+        area, y, z = (np.concatenate(column).astype(np.float64, copy=False) for column in zip(*parts))
+        return area, y, z
 
     def get_area(self) -> float:
         """Calculate the total cross-sectional area from fibers.
@@ -497,7 +488,8 @@ class FiberSection(Section):
         Returns:
             The sum of all fiber areas.
         """
-        return float(sum(a for a, _, _ in self._discretize_to_fibers()))
+        area, _, _ = self._discretize_to_arrays()
+        return float(area.sum())
 
     def get_Iy(self) -> float:
         """Calculate the second moment of area about the local y-axis.
@@ -505,17 +497,12 @@ class FiberSection(Section):
         Returns:
             The computed Iy value.
         """
-        comps = self._discretize_to_fibers()
-        if not comps:
-            return 0.0
-        area = sum(a for a, _, _ in comps)
-        if area <= 0:
+        area, _, z = self._discretize_to_arrays()
+        total = area.sum()
+        if area.size == 0 or total <= 0:
             return 0.0
-        z_bar = sum(a * z for a, _, z in comps) / area
-        Iy = 0.0
-        for a, _, z in comps:
-            Iy += a * (z - z_bar) ** 2
-        return float(Iy)
+        z_bar = np.dot(area, z) / total
+        return float(np.dot(area, (z - z_bar) ** 2))
 
     def get_Iz(self) -> float:
         """Calculate the second moment of area about the local z-axis.
@@ -523,17 +510,12 @@ class FiberSection(Section):
         Returns:
             The computed Iz value.
         """
-        comps = self._discretize_to_fibers()
-        if not comps:
+        area, y, _ = self._discretize_to_arrays()
+        total = area.sum()
+        if area.size == 0 or total <= 0:
             return 0.0
-        area = sum(a for a, _, _ in comps)
-        if area <= 0:
-            return 0.0
-        y_bar = sum(a * y for a, y, _ in comps) / area
-        Iz = 0.0
-        for a, y, _ in comps:
-            Iz += a * (y - y_bar) ** 2
-        return float(Iz)
+        y_bar = np.dot(area, y) / total
+        return float(np.dot(area, (y - y_bar) ** 2))
 
     def get_J(self) -> float:
         """Approximate the torsional constant as Iy + Iz.
@@ -650,19 +632,94 @@ class FiberSection(Section):
         Returns:
             The Matplotlib Figure object.
         """
+        return FiberSection.plot_from_arrays(
+            fiber_yz_area=np.column_stack(FiberSection._fiber_arrays(fibers)),
+            fiber_materials=[fiber.material for fiber in fibers],
+            patches=patches,
+            layers=layers,
+            ax=ax,
+            figsize=figsize,
+            show_fibers=show_fibers,
+            show_patches=show_patches,
+            show_layers=show_layers,
+            show_patch_outline=show_patch_outline,
+            show_fiber_grid=show_fiber_grid,
+            show_layer_line=show_layer_line,
+            title=title,
+            material_colors=material_colors,
+            save_path=save_path,
+            dpi=dpi,
+        )
+
+    @staticmethod
+    def plot_from_arrays(
+        fiber_yz_area: np.ndarray,
+        fiber_materials: Sequence[Material],
+        patches: List[PatchBase],
+        layers: List[LayerBase],
+        ax: Optional[plt.Axes] = None,
+        figsize: Tuple[float, float] = (10, 8),
+        show_fibers: bool = True,
+        show_patches: bool = True,
+        show_layers: bool = True,
+        show_patch_outline: bool = True,
+        show_fiber_grid: bool = True,
+        show_layer_line: bool = True,
+        title: Optional[str] = None,
+        material_colors: Optional[Dict[str, str]] = None,
+        save_path: Optional[str] = None,
+        dpi: int = 300,
+    ) -> plt.Figure:
+        """Plot section components with individual fibers given as arrays.
+
+        This is the array form of ``plot_components`` for callers that hold raw
+        fiber data and do not need ``FiberElement`` objects.
+
+        Args:
+            fiber_yz_area: Array of shape ``(n, 3)`` holding y, z and area per fiber.
+            fiber_materials: Material of each fiber, in the same order.
+            patches: Patch components to draw.
+            layers: Layer components to draw.
+            ax: Optional Matplotlib axes. If None, a new figure is created.
+            figsize: Figure size for the new plot.
+            show_fibers: Whether to draw small markers at each fiber location.
+            show_patches: Whether to draw filled polygons for patches.
+            show_layers: Whether to draw markers or lines for layers.
+            show_patch_outline: Whether to highlight patch boundaries.
+            show_fiber_grid: Whether to draw internal grid lines for patches.
+            show_layer_line: Whether to draw the center-line of layers.
+            title: Optional plot title.
+            material_colors: Optional map from material names to color strings.
+            save_path: Optional file path to save the image.
+            dpi: Resolution for the saved image.
+
+        Returns:
+            The Matplotlib Figure object.
+        """
+        fiber_yz_area = np.asarray(fiber_yz_area, dtype=np.float64).reshape(-1, 3)
+        if len(fiber_materials) != len(fiber_yz_area):
+            raise ValueError("fiber_materials must have one entry per fiber row")
+        y, z, area = fiber_yz_area.T
+
         if ax is None:
             fig, ax = plt.subplots(figsize=figsize)
         else:
             fig = ax.get_figure()
 
         if material_colors is None:
-            material_colors = FiberSection.generate_material_colors(fibers, patches, layers)
-
-        scale_factor = FiberSection.calculate_scale_factor(fibers)
+            material_colors = FiberSection._colors_for_materials(
+                list(fiber_materials)
+                + [patch.material for patch in patches]
+                + [layer.material for layer in layers]
+            )
 
-        if show_fibers:
-            for fiber in fibers:
-                fiber.plot(ax, material_colors, scale_factor, show_fibers=True)
+        if show_fibers and len(fiber_materials) > 0:
+            scale_factor = FiberSection._scale_factor_from_coords(y, z)
+            names, material_ids = np.unique(
+                [material.user_name for material in fiber_materials], return_inverse=True
+            )
+            palette = to_rgba_array([material_colors.get(name, "blue") for name in names])
+            FiberSection._add_fiber_arrays_to_axes(ax, y, z, area, palette[material_ids], scale_factor)
         if show_patches:
             for patch in patches:
                 patch.plot(ax, material_colors, show_patch_outline, show_fiber_grid)
@@ -677,7 +734,7 @@ class FiberSection(Section):
             ax.set_title(title)
 
         FiberSection._add_legend_to_axes(ax, material_colors)
-        FiberSection._add_section_info_to_axes(ax, fibers, patches, layers)
+        FiberSection._add_section_info_to_axes(ax, len(fiber_materials), patches, layers)
         fig.tight_layout()
 
         if save_path:
@@ -685,6 +742,36 @@ class FiberSection(Section):
 
         return fig
 
+    @staticmethod
+    def _fiber_arrays(fibers: List[FiberElement]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the y, z and area of ``fibers`` as parallel float arrays."""
+        count = len(fibers)
+        y = np.fromiter((fiber.y_loc for fiber in fibers), dtype=np.float64, count=count)
+        z = np.fromiter((fiber.z_loc for fiber in fibers), dtype=np.float64, count=count)
+        area = np.fromiter((fiber.area for fiber in fibers), dtype=np.float64, count=count)
+        return y, z, area
+
+    @staticmethod
+    def _add_fiber_arrays_to_axes(
+        ax: plt.Axes,
+        y: np.ndarray,
+        z: np.ndarray,
+        area: np.ndarray,
+        facecolors: np.ndarray,
+        scale_factor: float,
+    ) -> None:
+        """Draw fibers as one collection of circles sized in data units."""
+        diameters = np.sqrt(area) * scale_factor
+        offsets = np.column_stack([y, z])
+        ax.add_collection(EllipseCollection(
+            diameters, diameters, np.zeros_like(diameters), units="xy",
+            offsets=offsets, offset_transform=ax.transData,
+            facecolors=facecolors, edgecolors="black", linewidths=0.5, alpha=0.7,
+        ))
+        radii = (diameters / 2)[:, None]
+        ax.update_datalim(np.concatenate([offsets - radii, offsets + radii]))
+        ax.autoscale_view()
+
     @staticmethod
     def generate_material_colors(
         fibers: List[FiberElement],
@@ -692,16 +779,19 @@ class FiberSection(Section):
         layers: List[LayerBase],
     ) -> Dict[str, str]:
         """Generate a stable color mapping for materials in the section."""
+        return FiberSection._colors_for_materials(
+            [fiber.material for fiber in fibers]
+            + [patch.material for patch in patches]
+            + [layer.material for layer in layers]
+        )
+
+    @staticmethod
+    def _colors_for_materials(all_materials: List[Material]) -> Dict[str, str]:
+        """Assign palette colors to materials in order of first appearance."""
         materials = []
-        for fiber in fibers:
-            if fiber.material not in materials:
-                materials.append(fiber.material)
-        for patch in patches:
-            if patch.material not in materials:
-                materials.append(patch.material)
-        for layer in layers:
-            if layer.material not in materials:
-                materials.append(layer.material)
+        for material in all_materials:
+            if material not in materials:
+                materials.append(material)
         colors = [
             "tab:blue",
             "tab:orange",
@@ -724,13 +814,14 @@ class FiberSection(Section):
         """Determine a visualization scale factor based on fiber distribution."""
         if not fibers:
             return 1.0
-        y_coords = [fiber.y_loc for fiber in fibers]
-        z_coords = [fiber.z_loc for fiber in fibers]
-        if not y_coords or not z_coords:
+        y_coords, z_coords, _ = FiberSection._fiber_arrays(fibers)
+        return FiberSection._scale_factor_from_coords(y_coords, z_coords)
+
+    @staticmethod
+    def _scale_factor_from_coords(y_coords: np.ndarray, z_coords: np.ndarray) -> float:
+        if y_coords.size == 0:
             return 1.0
-        y_range = max(y_coords) - min(y_coords)
-        z_range = max(z_coords) - min(z_coords)
-        coord_range = max(y_range, z_range)
+        coord_range = float(max(np.ptp(y_coords), np.ptp(z_coords)))
         if coord_range == 0:
             return 1.0
         return coord_range / 50.0
@@ -754,18 +845,18 @@ class FiberSection(Section):
     @staticmethod
     def _add_section_info_to_axes(
         ax: plt.Axes,
-        fibers: List[FiberElement],
+        num_fibers: int,
         patches: List[PatchBase],
         layers: List[LayerBase],
     ) -> None:
-        total_fibers = len(fibers)
+        total_fibers = num_fibers
         for patch in patches:
             total_fibers += patch.estimate_fiber_count()
         for layer in layers:
             if hasattr(layer, "num_fibers"):
                 total_fibers += layer.num_fibers
         info_text = (
-            f"Fibers: {len(fibers)}\n"
+            f"Fibers: {num_fibers}\n"
             f"Patches: {len(patches)}\n"
             f"Layers: {len(layers)}\n"
             f"Est. Total Fibers: {total_fibers}"
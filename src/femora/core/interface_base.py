@@ -11,6 +11,8 @@ from abc import ABC
 from collections import defaultdict
 from typing import TYPE_CHECKING, Dict, List, Optional
 
+import numpy as np
+
 from femora.core.event_bus import FemoraEvent
 
 if TYPE_CHECKING:
@@ -85,6 +87,12 @@ class InterfaceManager:
 
         self._interfaces: Dict[str, InterfaceBase] = {}
         self._embeddedinfo_list: list = []
+        # Beam-solid solid-cell search indices for the current assembly,
+        # keyed by selected solid-part tags (None means all solids).
+        self._solid_search_contexts: dict = {}
+        # (mesh, stable argsort, sorted tags) of MeshPartTag_celldata for the
+        # current assembly, shared by beam-solid interfaces looking up parts.
+        self._meshpart_cell_index: Optional[tuple] = None
         self._beam_solid_count = 0
         self._beam_solid_conflict_subscribed = False
         if not isinstance(mesh_maker, ModelClass):
@@ -240,44 +248,62 @@ class InterfaceManager:
         embeddedinfo_list = self._embeddedinfo_list
         if not embeddedinfo_list:
             return  # nothing to do
-        # print("resolving core conflicts")
         # ----------------------------------------------------------
         # 1. Deduplicate identical EmbeddedInfo objects
         # ----------------------------------------------------------
-        unique_infos: list[EmbeddedInfo] = []
-        for info in embeddedinfo_list:
-            if all(info != u for u in unique_infos):
-                unique_infos.append(info)
-
-        infos = unique_infos
+        # EmbeddedInfo hashes its canonical form, so a dict keeps the first
+        # occurrence of each record in O(n).
+        infos: list[EmbeddedInfo] = list(dict.fromkeys(embeddedinfo_list))
         n = len(infos)
 
         # ----------------------------------------------------------
         # 2–3. Build similarity graph & detect conflicts
         # ----------------------------------------------------------
-        parent = list(range(n))  # union-find structure
+        # Union-find with path halving and union by rank.
+        parent = np.arange(n, dtype=np.int32)
+        rank = np.zeros(n, dtype=np.int32)
 
         def find(i: int) -> int:
             while parent[i] != i:
                 parent[i] = parent[parent[i]]
                 i = parent[i]
-            return i
+            return int(i)
 
         def union(i: int, j: int):
             pi, pj = find(i), find(j)
-            if pi != pj:
-                parent[pj] = pi
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                relation = infos[i].compare(infos[j])
-                if relation == "conflict":
-                    raise ValueError(
-                        f"EmbeddedInfo conflict detected between {infos[i]} and {infos[j]}"
-                    )
-                elif relation == "similar":
-                    union(i, j)
-                # "equal" already handled via deduplication
+            if pi == pj:
+                return
+            if rank[pi] < rank[pj]:
+                pi, pj = pj, pi
+            parent[pj] = pi
+            if rank[pi] == rank[pj]:
+                rank[pi] += 1
+
+        # Infos can only relate through identical beams or a shared solid, so
+        # bucket them by both keys instead of comparing every pair.
+        by_beams = defaultdict(list)  # beams → list[info index]
+        by_solid = defaultdict(list)  # solid cell id → list[info index]
+        for idx, info in enumerate(infos):
+            by_beams[info.beams].append(idx)
+            for solid in info.solids_set:
+                by_solid[solid].append(idx)
+
+        for members in by_beams.values():
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    relation = infos[i].compare(infos[j])
+                    if relation == "conflict":
+                        raise ValueError(
+                            f"EmbeddedInfo conflict detected between {infos[i]} and {infos[j]}"
+                        )
+                    elif relation == "similar":
+                        union(i, j)
+                    # "equal" already handled via deduplication
+
+        # Different beams sharing a solid are always "similar".
+        for members in by_solid.values():
+            for j in members[1:]:
+                union(members[0], j)
 
         # ----------------------------------------------------------
         # 4. Apply lowest core number per connected component
@@ -286,38 +312,31 @@ class InterfaceManager:
         for idx in range(n):
             groups[find(idx)].append(idx)
 
+        # Write through one plain view of the Core array instead of going
+        # through the VTK-backed proxy on every group.
+        core = np.asarray(assembled_mesh.cell_data["Core"])
+        replacements: dict[EmbeddedInfo, EmbeddedInfo] = {}
         for idx_list in groups.values():
             min_core = min(infos[i].core_number for i in idx_list)
+            cells: set[int] = set()
             for i in idx_list:
                 info = infos[i]
-                # Create a new EmbeddedInfo with updated core_number
-                new_info = EmbeddedInfo(
-                    beams=info.beams,
-                    core_number=min_core,
-                    beams_solids=info.beams_solids
-                )
-                infos[i] = new_info
-                for idx, orig in enumerate(embeddedinfo_list):
-                    if orig == info:
-                        embeddedinfo_list[idx] = new_info
-                for interface in self._interfaces.values():
-                    if not isinstance(interface, EmbeddedBeamSolidInterface):
-                        continue
-                    inst_list = interface._instance_embeddedinfo_list
-                    for idx2, orig2 in enumerate(inst_list):
-                        if orig2 == info:
-                            inst_list[idx2] = new_info
-                for _beams, solids in new_info.beams_solids:
-                    try:
-                        assembled_mesh.cell_data["Core"][solids] = min_core
-                    except Exception as exc:
-                        print(
-                            f"[EmbeddedBeamSolidInterface] Failed to set core for solids {solids}: {exc}"
-                        )
-                try:
-                    assembled_mesh.cell_data["Core"][list(new_info.beams)] = min_core
-                except Exception as exc:
-                    print(f"[EmbeddedBeamSolidInterface] Failed to set core for beams {new_info.beams}: {exc}")
+                cells.update(info.beams)
+                cells.update(info.solids_set)
+                if info.core_number != min_core:
+                    replacements[info] = info.with_core_number(min_core)
+            # One scatter per connected component.
+            core[np.fromiter(cells, dtype=np.int32, count=len(cells))] = min_core
+        assembled_mesh.Modified()
+
+        if not replacements:
+            return
+        embeddedinfo_list[:] = [replacements.get(info, info) for info in embeddedinfo_list]
+        for interface in self._interfaces.values():
+            if not isinstance(interface, EmbeddedBeamSolidInterface):
+                continue
+            inst_list = interface._instance_embeddedinfo_list
+            inst_list[:] = [replacements.get(info, info) for info in inst_list]
 
     def remove(self, name: str) -> None:
         interface = self._interfaces.pop(name, None)
@@ -330,5 +349,7 @@ class InterfaceManager:
             self._release_interface(interface)
         self._interfaces.clear()
         self._embeddedinfo_list.clear()
+        self._solid_search_contexts.clear()
+        self._meshpart_cell_index = None
         self._boundary_absorbers.clear()
         self._release_boundary_absorber_subscription()
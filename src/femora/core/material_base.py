@@ -8,7 +8,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
 
 
 class Material(ABC):
@@ -18,24 +21,118 @@ class Material(ABC):
     A :class:`~femora.core.material_manager.MaterialManager` owns lifecycle
     operations, tag assignment, removal, and retagging for a local model context.
 
+    Concrete subclasses declare ``material_type``, ``material_name`` and the
+    derived ``_tcl_prefix`` as class constants shared by all instances.
+
     Args:
-        material_type: OpenSees material category (e.g. ``'nDMaterial'``).
-        material_name: Concrete OpenSees material name (e.g. ``'ElasticIsotropic'``).
         user_name: User-specified label for this material instance.
 
     Attributes:
+        material_type: OpenSees material category (e.g. ``'nDMaterial'``).
+        material_name: Concrete OpenSees material name (e.g. ``'ElasticIsotropic'``).
         tag: Manager-assigned OpenSees material tag.  Remains ``None`` until
             this object is added to a :class:`~femora.core.material_manager.MaterialManager`.
         _owner: Reference to the owning manager, or ``None`` when unmanaged.
+        _PARAMETERS: Class-constant parameter names in Tcl emission order for
+            materials with a fixed layout.  Empty when the emitted parameter
+            set depends on the constructor arguments.
     """
 
-    def __init__(self, material_type: str, material_name: str, user_name: str):
+    __slots__ = (
+        "tag",
+        "_owner",
+        "user_name",
+        "_params",
+        "_params_tcl_cache",
+        "__weakref__",
+    )
+
+    material_type: str = ""
+    material_name: str = ""
+    _tcl_prefix: str = ""
+    _PARAMETERS: Tuple[str, ...] = ()
+
+    def __init__(self, user_name: str):
         self.tag: Optional[int] = None
         self._owner: object | None = None
-        self.material_type = material_type
-        self.material_name = material_name
         self.user_name = user_name
-        self.params: Dict[str, Any] = {}
+        self.params = {}
+
+    # ------------------------------------------------------------------
+    # Parameter storage
+    # ------------------------------------------------------------------
+
+    @property
+    def params(self) -> Mapping[str, Any]:
+        """Stored parameter values keyed by OpenSees argument name.
+
+        The mapping is read-only; assign a new mapping to ``params`` to change
+        values so the cached Tcl parameter string stays in sync.
+        """
+        return MappingProxyType(self._params)
+
+    @params.setter
+    def params(self, values: Mapping[str, Any]) -> None:
+        self._params = dict(values)
+        self._params_tcl_cache: Optional[str] = None
+
+    @classmethod
+    def get_parameters(cls) -> Tuple[str, ...]:
+        """Return the class-constant parameter names in Tcl emission order.
+
+        The shared ``_PARAMETERS`` tuple is returned as-is, so repeated calls
+        allocate nothing.  Materials whose parameter set depends on the
+        constructor arguments return an empty tuple.
+        """
+        return cls._PARAMETERS
+
+    def param_values(self) -> np.ndarray:
+        """Return the parameter values as a ``float64`` array.
+
+        Arrays from materials of the same fixed-layout class line up column by
+        column, which allows vectorized aggregation over many materials.
+
+        Raises:
+            ValueError: If a parameter value is not a scalar number.
+        """
+        try:
+            return np.asarray(self._ordered_values(), dtype=np.float64)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(
+                f"Material '{self.user_name}' has non-numeric parameter values."
+            ) from exc
+
+    def _ordered_values(self) -> List[Any]:
+        """Return ``params`` values in ``_PARAMETERS`` order, or insertion order."""
+        p = self._params
+        if self._PARAMETERS:
+            return [p[key] for key in self._PARAMETERS]
+        return list(p.values())
+
+    def _params_tcl(self) -> str:
+        """Return the ordered ``params`` values joined for Tcl output.
+
+        The joined string is built on first use and reused until ``params`` is
+        reassigned, so repeated exports do not re-format every value.
+        """
+        cached = self._params_tcl_cache
+        if cached is None:
+            cached = " ".join(map(str, self._ordered_values()))
+            self._params_tcl_cache = cached
+        return cached
+
+    def _params_tcl_command(self) -> str:
+        """Render ``<type> <name> <tag> <params>; # <user_name>`` as one command.
+
+        Shared by materials whose Tcl form is the class prefix followed by the
+        tag and the ordered parameter values.
+        """
+        return "%s %s %s; # %s" % (
+            self._tcl_prefix,
+            self._require_tag(),
+            self._params_tcl(),
+            self.user_name,
+        )
 
     # ------------------------------------------------------------------
     # Tag helpers
@@ -76,6 +173,11 @@ class Material(ABC):
         """Return the value of a stored parameter by key."""
         return self.params[key]
 
+    def get_values(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the stored values for *keys*, skipping keys that are not set."""
+        p = self._params
+        return {key: p[key] for key in keys if key in p}
+
     # ------------------------------------------------------------------
     # Dunder helpers
     # ------------------------------------------------------------------
@@ -7,7 +7,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Iterator, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
 
 from femora.core.nd_material_manager import NDMaterialManager
 from femora.core.uniaxial_material_manager import UniaxialMaterialManager
@@ -64,27 +64,80 @@ class MaterialManager:
         """
         if not isinstance(material, Material):
             raise TypeError("material must be a Material instance")
-        if material._owner is None:
-            material._owner = self
-        elif material._owner is not self:
+        if material._owner is not None and material._owner is not self:
             raise ValueError("material already belongs to another manager")
-        existing_by_name = self._names.get(material.user_name)
-        if existing_by_name is not None and existing_by_name is not material:
+        managed = material._owner is self
+        # One hash both checks the name and reserves it for this material.
+        if self._names.setdefault(material.user_name, material) is not material:
             raise ValueError(f"Material user_name '{material.user_name}' already exists")
 
         try:
-            material.tag = self._tagging.assign_tag(
-                self._materials, material, self._start_tag
-            )
+            tag = self._tagging.assign_tag(self._materials, material, self._start_tag)
         except ValueError as exc:
+            if not managed:
+                del self._names[material.user_name]
             raise ValueError(
                 f"Material tag {material.tag} already exists"
             ) from exc
 
-        self._materials[material.tag] = material
-        self._names[material.user_name] = material
+        material.tag = tag
+        material._owner = self
+        self._materials[tag] = material
         return material
 
+    def add_many(self, materials: Iterable[Material]) -> List[Material]:
+        """Add several materials at once, allocating their tags in one pass.
+
+        The whole batch is validated before any material is stored, so a
+        failure leaves the manager unchanged.  Materials without a preassigned
+        tag receive the lowest free tags in input order.
+
+        Args:
+            materials: Unmanaged or already-managed :class:`Material` instances.
+
+        Returns:
+            The added materials, in input order.
+
+        Raises:
+            TypeError: If any item is not a :class:`Material` instance.
+            ValueError: If a material belongs to another manager, if a user name
+                or preassigned tag collides with another material, or if the
+                batch repeats a user name or tag.
+        """
+        materials = list(dict.fromkeys(materials))
+        reserved: Dict[int, Material] = dict(self._materials)
+        batch_names: Dict[str, Material] = {}
+        for material in materials:
+            if not isinstance(material, Material):
+                raise TypeError("material must be a Material instance")
+            if material._owner is not None and material._owner is not self:
+                raise ValueError("material already belongs to another manager")
+            existing_by_name = batch_names.get(
+                material.user_name, self._names.get(material.user_name)
+            )
+            if existing_by_name is not None and existing_by_name is not material:
+                raise ValueError(f"Material user_name '{material.user_name}' already exists")
+            batch_names[material.user_name] = material
+            if material.tag is not None:
+                if reserved.get(material.tag, material) is not material:
+                    raise ValueError(f"Material tag {material.tag} already exists")
+                reserved[material.tag] = material
+
+        pending = [material for material in materials if material.tag is None]
+        tags = self._tagging.next_available_tags(reserved, self._start_tag, len(pending))
+        for material, tag in zip(pending, tags.tolist()):
+            material.tag = tag
+        for material in materials:
+            material._owner = self
+            self._materials[material.tag] = material
+            self._names[material.user_name] = material
+        return materials
+
+    def _ensure_name_available(self, user_name: str) -> None:
+        """Raise before a material is built when *user_name* is already taken."""
+        if user_name in self._names:
+            raise ValueError(f"Material user_name '{user_name}' already exists")
+
     def get(self, tag: int) -> Optional[Material]:
         """Return the material with *tag* if it exists, otherwise ``None``."""
         return self._materials.get(int(tag))
@@ -144,15 +197,12 @@ class MaterialManager:
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _next_available_tag(self) -> int:
-        return self._tagging.next_available_tag(self._materials, self._start_tag)
-
     def _reassign_tags(self) -> None:
-        """Rebuild *_materials* and *_names* after a removal or start-tag change."""
-        # Retag objects (updates obj.tag in place and rebuilds _materials dict)
+        """Rebuild *_materials* after a removal or start-tag change."""
+        # Retag objects (updates obj.tag in place and rebuilds _materials dict).
+        # *_names* maps user names to the material objects themselves, so it
+        # stays valid across retagging and does not need to be rebuilt.
         self._tagging.reassign_tags(self._materials, self._start_tag)
-        # Rebuild name index to stay consistent
-        self._names = {mat.user_name: mat for mat in self._materials.values()}
 
 
 __all__ = ["MaterialManager"]
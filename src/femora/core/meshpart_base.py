@@ -8,10 +8,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional, Type
+from typing import TYPE_CHECKING, Optional, Type
 
 import numpy as np
-import pyvista as pv
 
 from femora.components.geometry_ops import MeshPartTransform
 from femora.constants import FEMORA_MAX_NDF
@@ -19,6 +18,9 @@ from femora.core.damping_base import Damping
 from femora.core.element_base import Element
 from femora.core.region_base import RegionBase
 
+if TYPE_CHECKING:
+    import pyvista as pv
+
 
 class MeshPart(ABC):
     """Base class for mesh parts on one Model model.
@@ -77,6 +79,8 @@ class MeshPart(ABC):
     def plot(self, off_screen: bool = False, screenshot: Optional[str] = None, **kwargs) -> None:
         if self.mesh is None:
             raise ValueError("Mesh not generated yet. Call generate_mesh() first.")
+        import pyvista as pv
+
         self._ensure_mass_array()
         plotter = pv.Plotter(off_screen=off_screen)
         plotter.add_mesh(self.mesh, **kwargs)
@@ -342,20 +342,26 @@ class MeshPartManager:
     def add(self, meshpart: MeshPart) -> MeshPart:
         if not isinstance(meshpart, MeshPart):
             raise TypeError("meshpart must be a MeshPart instance")
-        if meshpart.user_name in self._meshparts and self._meshparts[meshpart.user_name] is not meshpart:
-            raise ValueError(f"Mesh part name '{meshpart.user_name}' is already in use")
-        if meshpart.region is None:
-            meshpart.region = self._mesh_maker.region.global_region
-        if meshpart._owner is None:
-            meshpart._owner = self
-        elif meshpart._owner is not self:
+        if meshpart._owner is not None and meshpart._owner is not self:
             raise ValueError("meshpart already belongs to another manager")
-        by_tag = {p.tag: p for p in self._meshparts.values() if p.tag is not None}
+        managed = meshpart._owner is self
+        # One hash both checks the name and reserves it for this mesh part.
+        if self._meshparts.setdefault(meshpart.user_name, meshpart) is not meshpart:
+            raise ValueError(f"Mesh part name '{meshpart.user_name}' is already in use")
+        by_tag = {
+            p.tag: p
+            for p in self._meshparts.values()
+            if p.tag is not None and p is not meshpart
+        }
         try:
             meshpart.tag = self._tagging.assign_tag(by_tag, meshpart, self._start_tag)
         except ValueError as exc:
+            if not managed:
+                del self._meshparts[meshpart.user_name]
             raise ValueError(f"MeshPart tag {meshpart.tag} already exists") from exc
-        self._meshparts[meshpart.user_name] = meshpart
+        if meshpart.region is None:
+            meshpart.region = self._mesh_maker.region.global_region
+        meshpart._owner = self
         return meshpart
 
     def get(self, user_name: str) -> Optional[MeshPart]:
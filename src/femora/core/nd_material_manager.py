@@ -7,15 +7,6 @@
 
 from __future__ import annotations
 
-from femora.components.material.nd import (
-    DruckerPragerMaterial,
-    ElasticIsotropicMaterial,
-    J2CyclicBoundingSurfaceMaterial,
-    LinearElasticGGmaxMaterial,
-    PressureDependMultiYieldMaterial,
-    PressureIndependMultiYieldMaterial,
-)
-
 
 class NDMaterialManager:
     """Bound factory namespace for nD material creation."""
@@ -31,6 +22,11 @@ class NDMaterialManager:
             kwargs["user_name"] = kwargs.pop("name")
         return kwargs
 
+    def _add(self, material_cls, user_name, **params):
+        # Check the name first so a duplicate does not pay for validation.
+        self._manager._ensure_name_available(user_name)
+        return self._manager.add(material_cls(user_name=user_name, **params))
+
     def elastic_isotropic(
         self,
         user_name: str = "Unnamed",
@@ -39,59 +35,65 @@ class NDMaterialManager:
         rho: float = 0.0,
         **kwargs,
     ):
+        from femora.components.material.nd.elastic_isotropic import ElasticIsotropicMaterial
+
         kwargs = self._normalize_user_name(kwargs)
-        return self._manager.add(
-            ElasticIsotropicMaterial(
-                user_name=kwargs.pop("user_name", user_name),
-                E=E,
-                nu=nu,
-                rho=rho,
-            )
+        return self._add(
+            ElasticIsotropicMaterial,
+            kwargs.pop("user_name", user_name),
+            E=E,
+            nu=nu,
+            rho=rho,
         )
 
     def j2_cyclic_bounding_surface(self, user_name: str = "Unnamed", **kwargs):
+        from femora.components.material.nd.j2_cyclic_bounding_surface import J2CyclicBoundingSurfaceMaterial
+
         kwargs = self._normalize_user_name(kwargs)
-        return self._manager.add(
-            J2CyclicBoundingSurfaceMaterial(
-                user_name=kwargs.pop("user_name", user_name),
-                **kwargs,
-            )
+        return self._add(
+            J2CyclicBoundingSurfaceMaterial,
+            kwargs.pop("user_name", user_name),
+            **kwargs,
         )
 
     def drucker_prager(self, user_name: str = "Unnamed", **kwargs):
+        from femora.components.material.nd.drucker_prager import DruckerPragerMaterial
+
         kwargs = self._normalize_user_name(kwargs)
-        return self._manager.add(
-            DruckerPragerMaterial(
-                user_name=kwargs.pop("user_name", user_name),
-                **kwargs,
-            )
+        return self._add(
+            DruckerPragerMaterial,
+            kwargs.pop("user_name", user_name),
+            **kwargs,
         )
 
     def pressure_depend_multi_yield(self, user_name: str = "Unnamed", **kwargs):
+        from femora.components.material.nd.pressure_depend_multi_yield import PressureDependMultiYieldMaterial
+
         kwargs = self._normalize_user_name(kwargs)
-        return self._manager.add(
-            PressureDependMultiYieldMaterial(
-                user_name=kwargs.pop("user_name", user_name),
-                **kwargs,
-            )
+        return self._add(
+            PressureDependMultiYieldMaterial,
+            kwargs.pop("user_name", user_name),
+            **kwargs,
         )
 
     def linear_elastic_ggmax(self, user_name: str = "Unnamed", **kwargs):
+        from femora.components.material.nd.linear_elastic_ggmax import LinearElasticGGmaxMaterial
+
         kwargs = self._normalize_user_name(kwargs)
-        return self._manager.add(
-            LinearElasticGGmaxMaterial(
-                user_name=kwargs.pop("user_name", user_name),
-                **kwargs,
-            )
+        return self._add(
+            LinearElasticGGmaxMaterial,
+            kwargs.pop("user_name", user_name),
+            **kwargs,
         )
 
     def pressure_independ_multi_yield(self, user_name: str = "Unnamed", **kwargs):
+        from femora.components.material.nd.pressure_independ_multi_yield import PressureIndependMultiYieldMaterial
+
         kwargs = self._normalize_user_name(kwargs)
-        return self._manager.add(
-            PressureIndependMultiYieldMaterial(
-                user_name=kwargs.pop("user_name", user_name),
-                **kwargs,
-            )
+        return self._add(
+            PressureIndependMultiYieldMaterial,
+            kwargs.pop("user_name", user_name),
+            **kwargs,
         )
 
 
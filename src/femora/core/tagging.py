@@ -10,6 +10,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Dict, Generic, TypeVar
 
+import numpy as np
+
 
 class TaggedObject(ABC):
     """Minimal protocol-like base for manager-owned tagged objects."""
@@ -70,6 +72,27 @@ class CompactRetagPolicy(TaggingPolicy[TTagged]):
             tag += 1
         return tag
 
+    @staticmethod
+    def next_available_tags(
+        store: Dict[int, TTagged], start_tag: int, count: int
+    ) -> np.ndarray:
+        """Return the first ``count`` unused tags at or above ``start_tag``.
+
+        At most ``len(store)`` tags can be taken inside
+        ``[start_tag, start_tag + len(store) + count)``, so occupancy of that
+        window is marked in one boolean mask and the free tags are read back
+        with a single ``flatnonzero`` instead of one scan per tag.
+        """
+        count = int(count)
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        span = len(store) + count
+        taken = np.zeros(span, dtype=bool)
+        if store:
+            offsets = np.fromiter(store.keys(), dtype=np.int64, count=len(store)) - start_tag
+            taken[offsets[(offsets >= 0) & (offsets < span)]] = True
+        return np.flatnonzero(~taken)[:count] + start_tag
+
 
 __all__ = [
     "TaggingPolicy",
@@ -7,11 +7,6 @@
 
 from __future__ import annotations
 
-from femora.components.material.uniaxial import (
-    ElasticUniaxialMaterial,
-    Steel01Material,
-)
-
 
 class UniaxialMaterialManager:
     """Bound factory namespace for uniaxial material creation."""
@@ -27,6 +22,11 @@ class UniaxialMaterialManager:
             kwargs["user_name"] = kwargs.pop("name")
         return kwargs
 
+    def _add(self, material_cls, user_name, **params):
+        # Check the name first so a duplicate does not pay for validation.
+        self._manager._ensure_name_available(user_name)
+        return self._manager.add(material_cls(user_name=user_name, **params))
+
     def elastic(
         self,
         user_name: str = "Unnamed",
@@ -35,24 +35,26 @@ class UniaxialMaterialManager:
         Eneg: float | None = None,
         **kwargs,
     ):
+        from femora.components.material.uniaxial.elastic import ElasticUniaxialMaterial
+
         kwargs = self._normalize_user_name(kwargs)
         params = dict(E=E, eta=eta)
         if Eneg is not None:
             params["Eneg"] = Eneg
-        return self._manager.add(
-            ElasticUniaxialMaterial(
-                user_name=kwargs.pop("user_name", user_name),
-                **params,
-            )
+        return self._add(
+            ElasticUniaxialMaterial,
+            kwargs.pop("user_name", user_name),
+            **params,
         )
 
     def steel01(self, user_name: str = "Unnamed", **kwargs):
+        from femora.components.material.uniaxial.steel01 import Steel01Material
+
         kwargs = self._normalize_user_name(kwargs)
-        return self._manager.add(
-            Steel01Material(
-                user_name=kwargs.pop("user_name", user_name),
-                **kwargs,
-            )
+        return self._add(
+            Steel01Material,
+            kwargs.pop("user_name", user_name),
+            **kwargs,
         )
 
 
@@ -821,7 +821,7 @@ if __name__ == "__main__":
     '''
     Test the AssemblyManagerTab GUI
     '''
-    from PySide6.QtWidgets import QApplication
+    from qtpy.QtWidgets import QApplication
     import sys
 
     # Preliminary setup of mesh parts for testing
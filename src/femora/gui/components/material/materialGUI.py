@@ -34,16 +34,24 @@ _GUI_MATERIAL_TYPES = {
 }
 
 
+# The table is fixed at import, so the dropdown labels are built once and
+# shared as tuples instead of being re-listed on every combo refresh.
+_GUI_MATERIAL_CATEGORIES = tuple(_GUI_MATERIAL_TYPES)
+_GUI_MATERIAL_TYPE_NAMES = {
+    category: tuple(types) for category, types in _GUI_MATERIAL_TYPES.items()
+}
+
+
 class _GuiMaterialForms:
     """Maps Tcl category/type labels to concrete classes for the material tab."""
 
     @staticmethod
     def get_material_categories():
-        return list(_GUI_MATERIAL_TYPES.keys())
+        return _GUI_MATERIAL_CATEGORIES
 
     @staticmethod
     def get_material_types(category):
-        return list(_GUI_MATERIAL_TYPES.get(category, {}).keys())
+        return _GUI_MATERIAL_TYPE_NAMES.get(category, ())
 
     @staticmethod
     def create_material(material_category, material_type, user_name, **params):
@@ -351,9 +359,7 @@ class MaterialEditDialog(QDialog):
         self.param_inputs = {}
         params = self.material.get_parameters()
         description = self.material.get_description()
-        current_values = {
-            p: self.material.params.get(p) for p in params if p in self.material.params
-        }
+        current_values = self.material.get_values(params)
 
         # Add label and input fields to the grid layout
         row = 0
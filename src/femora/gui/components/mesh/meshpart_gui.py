@@ -2,6 +2,9 @@
 This module provides the GUI components for managing mesh parts in the DRM Analyzer application.
 It includes the main tab for managing mesh parts, as well as dialogs for creating, editing, and viewing mesh parts.
 Classes:
+    MeshGenerationWorker(QThread): Runs a mesh part's generate_mesh off the GUI thread.
+    MeshGenerationProgressDialog(QProgressDialog): Busy indicator shown while a mesh is generated.
+    MeshPartTableModel(QAbstractTableModel): Read-only table model over the model's mesh parts.
     MeshPartManagerTab(QWidget): Main tab for managing mesh parts.
     MeshPartViewOptionsDialog(QDialog): Dialog for modifying view options of a MeshPart instance.
     MeshPartCreationDialog(QDialog): Dialog for creating a new mesh part.
@@ -23,24 +26,220 @@ Functions:
     save_mesh_part(): Save changes to the mesh part.
 
 '''
+import importlib
+
 from qtpy.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QComboBox, QPushButton, QTableWidget, QTableWidgetItem, 
+    QComboBox, QPushButton, QTableView, QAbstractItemView,
     QDialog, QGroupBox, QMessageBox, QHeaderView, QGridLayout, 
     QCheckBox, QDialogButtonBox, QColorDialog, QSlider, QTabWidget, QTextEdit,
-    QMenu
+    QMenu, QProgressDialog
 )
-from qtpy.QtCore import Qt
+from qtpy.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, QThread, Signal
 
-from femora.components.mesh.meshpart_registry import MeshPart, MeshPartRegistry
 from femora.core.element_base import Element
 from femora.core.element_manager import ElementManager
-from femora.gui.components.element.element_gui import ElementCreationDialog
-from femora.gui.components.element.beam_gui import BeamElementCreationDialog, is_beam_element
+from femora.core.region_base import RegionBase
 from femora.gui.plotter import PlotterManager
-from femora.components.mesh.meshparts import *
 from femora.components.MeshMaker import MeshMaker
 
+_VOLUME = "femora.components.mesh.volume_meshparts"
+_SURFACE = "femora.components.mesh.surface_meshparts"
+_LINE = "femora.components.mesh.line_meshparts"
+_GENERAL = "femora.components.mesh.general_meshparts"
+
+# GUI-only table for form construction (not a runtime registry). Classes are
+# given as (module, name) and imported on first use, so opening the GUI does
+# not load every mesh part module (and pyvista with them).
+_GUI_MESH_PART_TYPES = {
+    ("Volume mesh", "Uniform Rectangular Grid"): (_VOLUME, "StructuredRectangular3D"),
+    ("Volume mesh", "Custom Rectangular Grid"): (_VOLUME, "CustomRectangularGrid3D"),
+    ("Volume mesh", "Geometric Rectangular Grid"): (_VOLUME, "GeometricStructuredRectangular3D"),
+    ("Volume mesh", "Custom Mesh"): (_GENERAL, "ExternalMesh"),
+    ("Surface mesh", "Circular O-Grid"): (_SURFACE, "CircularOGrid2D"),
+    ("Line mesh", "Single Line"): (_LINE, "SingleLineMesh"),
+    ("Line mesh", "Structured Line Grid"): (_LINE, "StructuredLineMesh"),
+}
+
+# Category -> type names, in table order, for the dropdowns.
+_GUI_MESH_PART_CATEGORIES = {}
+for _category, _mesh_part_type in _GUI_MESH_PART_TYPES:
+    _GUI_MESH_PART_CATEGORIES.setdefault(_category, []).append(_mesh_part_type)
+
+
+class _GuiMeshPartForms:
+    """Maps category/type labels to concrete mesh part classes for the mesh tab."""
+
+    @staticmethod
+    def get_mesh_part_categories():
+        return list(_GUI_MESH_PART_CATEGORIES)
+
+    @staticmethod
+    def get_mesh_part_types(category):
+        return list(_GUI_MESH_PART_CATEGORIES.get(category, ()))
+
+    @staticmethod
+    def get_mesh_part_class(category, mesh_part_type):
+        location = _GUI_MESH_PART_TYPES.get((category, mesh_part_type))
+        if location is None:
+            raise ValueError(f"Unknown mesh part {category} / {mesh_part_type}")
+        module_name, class_name = location
+        return getattr(importlib.import_module(module_name), class_name)
+
+    @staticmethod
+    def create_mesh_part(category, mesh_part_type, user_name, element, region=None, **params):
+        cls = _GuiMeshPartForms.get_mesh_part_class(category, mesh_part_type)
+        inst = cls(user_name, element, region, **params)
+        return MeshMaker.get_instance().meshpart.add(inst)
+
+
+class MeshGenerationWorker(QThread):
+    """
+    Worker thread that runs ``generate_mesh`` off the GUI thread.
+    The outcome is reported from ``finished``, i.e. only after ``run`` has
+    returned, so receivers may close or delete the owning dialog safely.
+    """
+    mesh_generated = Signal(object)
+    error_occurred = Signal(str)
+
+    def __init__(self, mesh_part, parent=None):
+        super().__init__(parent)
+        self.mesh_part = mesh_part
+        self._error = None
+        self.finished.connect(self._report)
+
+    def run(self):
+        try:
+            self.mesh_part.generate_mesh()
+        except Exception as e:
+            self._error = str(e)
+
+    def _report(self):
+        """Emit the result on the GUI thread once the thread has finished"""
+        if self._error is None:
+            self.mesh_generated.emit(self.mesh_part)
+        else:
+            self.error_occurred.emit(self._error)
+
+
+class MeshGenerationProgressDialog(QProgressDialog):
+    """Busy indicator that cannot be dismissed until mesh generation is over"""
+    def __init__(self, parent):
+        super().__init__("Generating mesh...", "", 0, 0, parent)
+        self.setCancelButton(None)
+        self.setWindowModality(Qt.WindowModal)
+        self._done = False
+
+    def finish(self):
+        """Close the indicator once the worker has reported back"""
+        self._done = True
+        self.close()
+
+    def reject(self):
+        # Escape maps to reject(); ignore it while the worker is running
+        if self._done:
+            super().reject()
+
+    def closeEvent(self, event):
+        if self._done:
+            super().closeEvent(event)
+        else:
+            event.ignore()
+
+
+def _start_mesh_generation(dialog, mesh_part, on_generated, on_error):
+    """
+    Generate ``mesh_part``'s mesh on a worker thread behind a busy indicator.
+    The callbacks run back on the GUI thread, where the plotter can be used.
+    """
+    progress = MeshGenerationProgressDialog(dialog)
+    progress.show()
+
+    worker = MeshGenerationWorker(mesh_part, dialog)
+    worker.mesh_generated.connect(progress.finish)
+    worker.error_occurred.connect(progress.finish)
+    worker.mesh_generated.connect(on_generated)
+    worker.error_occurred.connect(on_error)
+    worker.finished.connect(progress.deleteLater)
+    worker.finished.connect(worker.deleteLater)
+    worker.start()
+    return worker
+
+
+class MeshPartTableModel(QAbstractTableModel):
+    """Read-only table model over the mesh parts of the current model."""
+
+    _HEADERS = ("Name", "Category", "Type")
+    _FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # Display text per row, built once per reload so data() is a lookup.
+        self._cells = []
+        self._row_by_name = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._cells[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return self._FLAGS if index.isValid() else Qt.NoItemFlags
+
+    @staticmethod
+    def _row_cells(user_name, mesh_part):
+        return (user_name, str(mesh_part.category), mesh_part.mesh_type)
+
+    def mesh_part_at(self, row):
+        """Return ``(user_name, mesh_part)`` for a table row."""
+        return self._rows[row]
+
+    def row_of(self, user_name):
+        """Return the row showing ``user_name``, or -1 if it is not listed."""
+        return self._row_by_name.get(user_name, -1)
+
+    def append_mesh_part(self, mesh_part):
+        """Add one row at the end of the table."""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append((mesh_part.user_name, mesh_part))
+        self._cells.append(self._row_cells(mesh_part.user_name, mesh_part))
+        self._row_by_name[mesh_part.user_name] = row
+        self.endInsertRows()
+
+    def remove_mesh_part(self, user_name):
+        """Drop the row showing ``user_name``, if any."""
+        row = self._row_by_name.pop(user_name, -1)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._cells[row]
+        for name, index in self._row_by_name.items():
+            if index > row:
+                self._row_by_name[name] = index - 1
+        self.endRemoveRows()
+
+    def reload(self):
+        """Re-read the mesh parts from the model manager."""
+        self.beginResetModel()
+        self._rows = list(MeshMaker.get_instance().meshpart.get_all().items())
+        self._cells = [self._row_cells(name, part) for name, part in self._rows]
+        self._row_by_name = {name: row for row, (name, _) in enumerate(self._rows)}
+        self.endResetModel()
+
 
 class MeshPartManagerTab(QWidget):
     def __init__(self, parent=None):
@@ -51,7 +250,7 @@ class MeshPartManagerTab(QWidget):
         # Mesh part type selection
         type_layout = QGridLayout()
         self.mesh_part_category_combo = QComboBox()
-        self.mesh_part_category_combo.addItems(MeshPartRegistry.get_mesh_part_categories())
+        self.mesh_part_category_combo.addItems(_GuiMeshPartForms.get_mesh_part_categories())
         
         # Update mesh part types when category changes
         self.mesh_part_category_combo.currentTextChanged.connect(self.update_mesh_part_types)
@@ -74,9 +273,9 @@ class MeshPartManagerTab(QWidget):
         layout.addLayout(type_layout)
         
         # Mesh parts table
-        self.mesh_parts_table = QTableWidget()
-        self.mesh_parts_table.setColumnCount(3)  # Name, Category, Type
-        self.mesh_parts_table.setHorizontalHeaderLabels(["Name", "Category", "Type"])
+        self.mesh_parts_model = MeshPartTableModel(self)
+        self.mesh_parts_table = QTableView()
+        self.mesh_parts_table.setModel(self.mesh_parts_model)
         header = self.mesh_parts_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)  # Stretch all columns
         
@@ -85,8 +284,8 @@ class MeshPartManagerTab(QWidget):
         self.mesh_parts_table.customContextMenuRequested.connect(self.show_context_menu)
         
         # Select full rows when clicking
-        self.mesh_parts_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.mesh_parts_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.mesh_parts_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.mesh_parts_table.setSelectionMode(QAbstractItemView.SingleSelection)
         
         layout.addWidget(self.mesh_parts_table)
         
@@ -125,8 +324,11 @@ class MeshPartManagerTab(QWidget):
 
     def update_mesh_part_types(self, category):
         """Update mesh part types based on selected category"""
+        # Don't fire index/text change signals for the intermediate states
+        self.mesh_part_type_combo.blockSignals(True)
         self.mesh_part_type_combo.clear()
-        self.mesh_part_type_combo.addItems(MeshPartRegistry.get_mesh_part_types(category))
+        self.mesh_part_type_combo.addItems(_GuiMeshPartForms.get_mesh_part_types(category))
+        self.mesh_part_type_combo.blockSignals(False)
 
     def open_mesh_part_creation_dialog(self):
         """
@@ -137,9 +339,9 @@ class MeshPartManagerTab(QWidget):
         
         dialog = MeshPartCreationDialog(category, mesh_part_type, self)
         
-        # Only refresh if a mesh part was actually created
-        if dialog.exec() == QDialog.Accepted and hasattr(dialog, 'created_mesh_part'):
-            self.refresh_mesh_parts_list()
+        # Only add a row if a mesh part was actually created
+        if dialog.exec() == QDialog.Accepted and dialog.created_mesh_part is not None:
+            self.mesh_parts_model.append_mesh_part(dialog.created_mesh_part)
 
     def open_mesh_part_view_dialog(self, mesh_part):
         """
@@ -152,31 +354,16 @@ class MeshPartManagerTab(QWidget):
         """
         Update the mesh parts table with current mesh parts
         """
-        # Clear existing rows
-        self.mesh_parts_table.setRowCount(0)
-        
-        # Get all mesh parts
-        mesh_parts = MeshPart.get_mesh_parts()
-        
-        # Set row count
-        self.mesh_parts_table.setRowCount(len(mesh_parts))
-        
-        # Populate table
-        for row, (user_name, mesh_part) in enumerate(mesh_parts.items()):
-            # Name
-            name_item = QTableWidgetItem(user_name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.mesh_parts_table.setItem(row, 0, name_item)
-            
-            # Category
-            category_item = QTableWidgetItem(str(mesh_part.category))
-            category_item.setFlags(category_item.flags() & ~Qt.ItemIsEditable)
-            self.mesh_parts_table.setItem(row, 1, category_item)
-            
-            # Mesh Part Type
-            type_item = QTableWidgetItem(mesh_part.mesh_type)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-            self.mesh_parts_table.setItem(row, 2, type_item)
+        self.mesh_parts_model.reload()
+
+    def selected_mesh_part(self):
+        """
+        Return ``(user_name, mesh_part)`` for the selected row, or ``None``
+        """
+        index = self.mesh_parts_table.currentIndex()
+        if not index.isValid():
+            return None
+        return self.mesh_parts_model.mesh_part_at(index.row())
 
     def show_context_menu(self, position):
         """
@@ -204,10 +391,9 @@ class MeshPartManagerTab(QWidget):
         """
         Handle the view action from the context menu
         """
-        selected_row = self.mesh_parts_table.currentRow()
-        if selected_row >= 0:
-            user_name = self.mesh_parts_table.item(selected_row, 0).text()
-            mesh_part = MeshPart.get_mesh_parts().get(user_name)
+        selected = self.selected_mesh_part()
+        if selected is not None:
+            user_name, mesh_part = selected
             if mesh_part:
                 # Check if mesh part is plotted (has an actor)
                 if mesh_part.actor is None:
@@ -224,10 +410,9 @@ class MeshPartManagerTab(QWidget):
         """
         Handle the edit action from the context menu
         """
-        selected_row = self.mesh_parts_table.currentRow()
-        if selected_row >= 0:
-            user_name = self.mesh_parts_table.item(selected_row, 0).text()
-            mesh_part = MeshPart.get_mesh_parts().get(user_name)
+        selected = self.selected_mesh_part()
+        if selected is not None:
+            user_name, mesh_part = selected
             if mesh_part:
                 self.open_mesh_part_edit_dialog(mesh_part)
 
@@ -235,10 +420,9 @@ class MeshPartManagerTab(QWidget):
         """
         Handle the info action from the context menu
         """
-        selected_row = self.mesh_parts_table.currentRow()
-        if selected_row >= 0:
-            user_name = self.mesh_parts_table.item(selected_row, 0).text()
-            mesh_part = MeshPart.get_mesh_parts().get(user_name)
+        selected = self.selected_mesh_part()
+        if selected is not None:
+            user_name, mesh_part = selected
             if mesh_part:
                 self.open_mesh_part_info_dialog(mesh_part)
 
@@ -246,10 +430,9 @@ class MeshPartManagerTab(QWidget):
         """
         Handle the delete action from the context menu
         """
-        selected_row = self.mesh_parts_table.currentRow()
-        if selected_row >= 0:
-            user_name = self.mesh_parts_table.item(selected_row, 0).text()
-            self.delete_mesh_part(user_name)
+        selected = self.selected_mesh_part()
+        if selected is not None:
+            self.delete_mesh_part(selected[0])
 
     def open_mesh_part_edit_dialog(self, mesh_part):
         """
@@ -276,10 +459,11 @@ class MeshPartManagerTab(QWidget):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            actor = MeshPart._mesh_parts[user_name].actor
+            meshparts = MeshMaker.get_instance().meshpart
+            actor = meshparts.get(user_name).actor
             PlotterManager.get_plotter().remove_actor(actor)
-            MeshPart.delete_mesh_part(user_name)
-            self.refresh_mesh_parts_list()
+            meshparts.remove(user_name)
+            self.mesh_parts_model.remove_mesh_part(user_name)
 
     def plot_all_mesh_parts(self):
         """
@@ -291,7 +475,7 @@ class MeshPartManagerTab(QWidget):
         plotter.clear()
         
         # Add all mesh parts to the plotter
-        for mesh_part in MeshPart.get_mesh_parts().values():
+        for mesh_part in MeshMaker.get_instance().meshpart.get_all().values():
             mesh_part.generate_mesh()
             mesh_part.actor = plotter.add_mesh(mesh_part.mesh, 
                                               style="surface",
@@ -313,7 +497,7 @@ class MeshPartManagerTab(QWidget):
         if reply == QMessageBox.Yes:
             plotter = PlotterManager.get_plotter()
             plotter.clear()
-            MeshPart.clear_all_mesh_parts()
+            MeshMaker.get_instance().meshpart.clear()
             self.refresh_mesh_parts_list()
 
 
@@ -340,6 +524,13 @@ class MeshPartViewOptionsDialog(QDialog):
         self.opacity_slider.setMaximum(100)
         self.opacity_slider.setValue(int(mesh_part.actor.GetProperty().GetOpacity() * 100))
         self.opacity_slider.valueChanged.connect(self.update_opacity)
+
+        # Throttle slider drags: the actor takes the latest value at most every 20 ms
+        self._pending_opacity = None
+        self._opacity_timer = QTimer(self)
+        self._opacity_timer.setSingleShot(True)
+        self._opacity_timer.setInterval(20)
+        self._opacity_timer.timeout.connect(self._apply_opacity)
         
         options_grid.addWidget(opacity_label, 0, 0)
         options_grid.addWidget(self.opacity_slider, 0, 1)
@@ -375,7 +566,21 @@ class MeshPartViewOptionsDialog(QDialog):
     
     def update_opacity(self, value):
         """Update mesh part opacity"""
-        self.mesh_part.actor.GetProperty().SetOpacity(value / 100.0)
+        self._pending_opacity = value / 100.0
+        # Don't restart a running timer, or a continuous drag would never apply
+        if not self._opacity_timer.isActive():
+            self._opacity_timer.start()
+
+    def _apply_opacity(self):
+        """Apply the last opacity requested by the slider"""
+        self.mesh_part.actor.GetProperty().SetOpacity(self._pending_opacity)
+
+    def done(self, result):
+        # Don't drop a slider value still waiting on the timer
+        if self._opacity_timer.isActive():
+            self._opacity_timer.stop()
+            self._apply_opacity()
+        super().done(result)
     
     def update_edge_visibility(self, state):
         """Toggle edge visibility"""
@@ -410,6 +615,8 @@ class MeshPartCreationDialog(QDialog):
         # Store the created mesh part
         self.created_mesh_part = None
         self.created_element = None
+        # Mesh generation worker while one is running
+        self.worker = None
         
         # Main Layout as horizontal to put notes on right
         main_layout = QHBoxLayout(self)
@@ -452,7 +659,7 @@ class MeshPartCreationDialog(QDialog):
         parameters_layout = QGridLayout(parameters_group)
 
         self.parameter_inputs = {}
-        self.mesh_part_class = MeshPartRegistry._mesh_part_types[category][mesh_part_type]
+        self.mesh_part_class = _GuiMeshPartForms.get_mesh_part_class(category, mesh_part_type)
         for row, (param_name, param_description) in enumerate(self.mesh_part_class.get_parameters()):
             param_input = QLineEdit()
             parameters_layout.addWidget(QLabel(f"{param_name}:"), row, 0)
@@ -464,12 +671,12 @@ class MeshPartCreationDialog(QDialog):
 
         # Buttons Layout
         buttons_layout = QHBoxLayout()
-        create_btn = QPushButton("Create")
-        create_btn.clicked.connect(self.create_mesh_part)
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        buttons_layout.addWidget(create_btn)
-        buttons_layout.addWidget(cancel_btn)
+        self.create_btn = QPushButton("Create")
+        self.create_btn.clicked.connect(self.create_mesh_part)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.create_btn)
+        buttons_layout.addWidget(self.cancel_btn)
 
         left_layout.addLayout(buttons_layout)
         
@@ -551,6 +758,9 @@ class MeshPartCreationDialog(QDialog):
         """
         Opens the appropriate ElementCreationDialog for creating a new element.
         """
+        from femora.gui.components.element.element_gui import ElementCreationDialog
+        from femora.gui.components.element.beam_gui import BeamElementCreationDialog, is_beam_element
+
         element_type = self.element_combo.currentText()
     
         if not element_type:
@@ -575,6 +785,8 @@ class MeshPartCreationDialog(QDialog):
         """
         Create a new mesh part based on input
         """
+        if self.worker is not None:
+            return  # the previous mesh part is still being generated
         try:
             # Validate and collect parameters
             user_name = self.user_name_input.text().strip()
@@ -595,19 +807,22 @@ class MeshPartCreationDialog(QDialog):
             # Get the current mesh part class
             category = self.parent().mesh_part_category_combo.currentText()
             mesh_part_type = self.parent().mesh_part_type_combo.currentText()
-            mesh_part_class = MeshPartRegistry._mesh_part_types[category][mesh_part_type]
+            mesh_part_class = _GuiMeshPartForms.get_mesh_part_class(category, mesh_part_type)
 
             # Validate parameters and create mesh part
             validated_params = mesh_part_class.validate_parameters(**params)
-            mesh_part = mesh_part_class(user_name=user_name,
-                                      element=self.created_element,
-                                      region=selected_region,
-                                      **validated_params)
+            mesh_part = _GuiMeshPartForms.create_mesh_part(
+                category,
+                mesh_part_type,
+                user_name,
+                self.created_element,
+                selected_region,
+                **validated_params,
+            )
 
-            # Mark as created and accept the dialog
+            # Mark as created; the dialog is accepted once the mesh is plotted
             self.created_mesh_part = mesh_part
             self.update_plotter()
-            self.accept()
 
         except Exception as e:
             if self.created_element:
@@ -624,11 +839,33 @@ class MeshPartCreationDialog(QDialog):
         Update the plotter with the new mesh part
         """
         self.plotter = PlotterManager.get_plotter()
-        self.created_mesh_part.generate_mesh()
-        self.created_mesh_part.actor = self.plotter.add_mesh(self.created_mesh_part.mesh, 
-                                                           style="surface",
-                                                           opacity=1.0,
-                                                           show_edges=True)
+        self.worker = _start_mesh_generation(
+            self, self.created_mesh_part, self._on_mesh_generated, self._on_mesh_error
+        )
+        self.create_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(False)
+
+    def _on_mesh_generated(self, mesh_part):
+        self.worker = None
+        mesh_part.actor = self.plotter.add_mesh(mesh_part.mesh,
+                                                style="surface",
+                                                opacity=1.0,
+                                                show_edges=True)
+        self.accept()
+
+    def _on_mesh_error(self, message):
+        self.worker = None
+        self.create_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(True)
+        # Unregister the mesh part so the user can fix the inputs and retry
+        MeshMaker.get_instance().meshpart.remove(self.created_mesh_part.user_name)
+        self.created_mesh_part = None
+        QMessageBox.warning(self, "Error", message)
+
+    def reject(self):
+        # The mesh part is registered and in use by the worker until it reports
+        if self.worker is None:
+            super().reject()
 
 class MeshPartEditDialog(QDialog):
     """
@@ -637,6 +874,8 @@ class MeshPartEditDialog(QDialog):
     def __init__(self, mesh_part, parent=None):
         super().__init__(parent)
         self.mesh_part = mesh_part
+        # Mesh generation worker while one is running
+        self.worker = None
         self.setWindowTitle(f"Edit Mesh Part: {mesh_part.user_name}")
         
         # Main Layout as horizontal to put notes on right
@@ -710,13 +949,13 @@ class MeshPartEditDialog(QDialog):
 
         # Buttons Layout
         buttons_layout = QHBoxLayout()
-        save_btn = QPushButton("Save")
-        save_btn.clicked.connect(self.save_mesh_part)
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
+        self.save_btn = QPushButton("Save")
+        self.save_btn.clicked.connect(self.save_mesh_part)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.reject)
         
-        buttons_layout.addWidget(save_btn)
-        buttons_layout.addWidget(cancel_btn)
+        buttons_layout.addWidget(self.save_btn)
+        buttons_layout.addWidget(self.cancel_btn)
 
         left_layout.addLayout(buttons_layout)
         
@@ -797,6 +1036,8 @@ class MeshPartEditDialog(QDialog):
         """
         Save changes to the mesh part
         """
+        if self.worker is not None:
+            return  # the mesh is still being regenerated
         try:
             # Update region
             selected_region = self.region_combo.currentData()
@@ -811,9 +1052,8 @@ class MeshPartEditDialog(QDialog):
             # Validate parameters
             self.mesh_part.update_parameters(**params)
 
-            # Regenerate mesh if needed
+            # Regenerate mesh; the dialog is accepted once it is plotted
             self.update_plotter()
-            self.accept()
         
         except Exception as e:
             QMessageBox.warning(self, "Error", str(e))
@@ -824,11 +1064,30 @@ class MeshPartEditDialog(QDialog):
         """
         self.plotter = PlotterManager.get_plotter()
         self.plotter.remove_actor(self.mesh_part.actor)
-        self.mesh_part.generate_mesh()
-        self.mesh_part.actor = self.plotter.add_mesh(self.mesh_part.mesh, 
-                                                    style="surface",
-                                                    opacity=1.0,
-                                                    show_edges=True)
+        self.worker = _start_mesh_generation(
+            self, self.mesh_part, self._on_mesh_generated, self._on_mesh_error
+        )
+        self.save_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(False)
+
+    def _on_mesh_generated(self, mesh_part):
+        self.worker = None
+        mesh_part.actor = self.plotter.add_mesh(mesh_part.mesh,
+                                                style="surface",
+                                                opacity=1.0,
+                                                show_edges=True)
+        self.accept()
+
+    def _on_mesh_error(self, message):
+        self.worker = None
+        self.save_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(True)
+        QMessageBox.warning(self, "Error", message)
+
+    def reject(self):
+        # The worker is still writing to the mesh part until it reports
+        if self.worker is None:
+            super().reject()
 
 class MeshPartNotesDialog(QDialog):
     """Dialog to display mesh part type notes"""
@@ -989,28 +1248,3 @@ class MeshPartInfoDialog(QDialog):
         
         # Set the text
         self.text_area.setPlainText(info_text)
-
-
-if __name__ == "__main__":
-    '''
-    Test the MeshPartManagerTab GUI
-    '''
-    from PySide6.QtWidgets import QApplication
-    from femora.components.material.nd import ElasticIsotropicMaterial
-    from femora.components.material.uniaxial import ElasticUniaxialMaterial
-    import sys
-    # Create the Qt Application
-    app = QApplication(sys.argv)
-    
-    ElasticIsotropicMaterial(user_name="Steel",    E=200e3, nu=0.3,  rho=7.85e-9)
-    ElasticIsotropicMaterial(user_name="Concrete", E=30e3,  nu=0.2,  rho=24e-9)
-    ElasticIsotropicMaterial(user_name="Aluminum", E=70e3,  nu=0.33, rho=2.7e-9)
-    ElasticUniaxialMaterial(user_name="Steel2",    E=200e3, eta=0.1)
-
-
-    # Create and display the main window
-    window = MeshPartManagerTab()
-    window.show()
-
-    
-    sys.exit(app.exec())
@@ -7,9 +7,9 @@ from qtpy.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox, QPushButton, QFormLayout, QMessageBox, QGridLayout, QFrame, QTextBrowser, QGroupBox, QWidget
 )
 
-from femora.components.section.section_opensees import AggregatorSection
-from femora.components.section.section_base import Section
-from femora.components.section.section_gui_utils import setup_material_dropdown, get_material_by_combo_selection, set_combo_to_material, setup_uniaxial_material_dropdown
+from femora.components.section import AggregatorSection
+from femora.core.section_base import Section
+from femora.gui.components.section.section_gui_utils import setup_material_dropdown, get_material_by_combo_selection, set_combo_to_material, setup_uniaxial_material_dropdown
 
 
 class AggregatorSectionCreationDialog(QDialog):
@@ -8,7 +8,7 @@ from qtpy.QtWidgets import (
 )
 from qtpy.QtCore import Qt
 
-from femora.components.section.section_opensees import BidirectionalSection
+from femora.components.section import BidirectionalSection
 
 class BidirectionalSectionCreationDialog(QDialog):
     """
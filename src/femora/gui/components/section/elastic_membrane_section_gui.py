@@ -9,7 +9,7 @@ from qtpy.QtWidgets import (
 )
 from qtpy.QtCore import Qt
 
-from femora.components.section.section_opensees import ElasticMembranePlateSection
+from femora.components.section import ElasticMembranePlateSection
 
 class ElasticMembranePlateSectionCreationDialog(QDialog):
     """
@@ -3,7 +3,8 @@ Updated Fiber Section GUI that is compatible with the current FiberSection imple
 Handles Material objects directly and uses the new constructor approach
 """
 
-from qtpy.QtCore import Qt
+import numpy as np
+from qtpy.QtCore import Qt, QTimer
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from qtpy.QtWidgets import (
@@ -14,13 +15,14 @@ from qtpy.QtWidgets import (
     QTextEdit, QSplitter, QCheckBox
 )
 
-from femora.components.section.section_opensees import (
+from femora.components.section import (
     FiberSection, FiberElement,
 )
-from femora.components.section.section_layer import *
-from femora.components.section.section_patch import *
+from femora.components.section.fiber import (
+    CircularLayer, StraightLayer, CircularPatch, QuadrilateralPatch, RectangularPatch,
+)
 from femora.core.material_base import Material
-from femora.components.section.section_gui_utils import(setup_uniaxial_material_dropdown,
+from femora.gui.components.section.section_gui_utils import(setup_uniaxial_material_dropdown,
                                                         validate_material_selection)
 
 
@@ -44,6 +46,14 @@ class FiberSectionCreationDialog(QDialog):
         self.fibers_data = []
         self.patches_data = []
         self.layers_data = []
+        # Components drawn by the last preview redraw, reused for info-only refreshes
+        self._preview_components = ([], [], [])
+        
+        # Coalesce bursts of edits (e.g. typing the name) into one preview redraw
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self._redraw_preview_plot)
         
         self.setup_ui()
         self.connect_signals()
@@ -95,6 +105,7 @@ class FiberSectionCreationDialog(QDialog):
         # Matplotlib figure for preview
         self.figure = Figure(figsize=(8, 6))
         self.canvas = FigureCanvas(self.figure)
+        self.preview_ax = self.figure.add_subplot(111)
         
         preview_group = QGroupBox("Section Preview")
         preview_layout = QVBoxLayout(preview_group)
@@ -635,12 +646,12 @@ class FiberSectionCreationDialog(QDialog):
 
     def connect_signals(self):
         """Connect UI signals"""
-        # Update plot when name changes
-        self.name_input.textChanged.connect(self.update_preview_plot)
+        # Only the plot title depends on the name
+        self.name_input.textChanged.connect(self.update_preview_title)
         
-        # Update plot when GJ changes
-        self.gj_checkbox.toggled.connect(self.update_preview_plot)
-        self.gj_input.valueChanged.connect(self.update_preview_plot)
+        # GJ only affects the info text, not the plot
+        self.gj_checkbox.toggled.connect(self.refresh_info_text)
+        self.gj_input.valueChanged.connect(self.refresh_info_text)
 
     def on_patch_type_changed(self, patch_type):
         """Handle patch type selection change"""
@@ -676,7 +687,7 @@ class FiberSectionCreationDialog(QDialog):
             }
             
             self.fibers_data.append(fiber_data)
-            self.update_fibers_table()
+            self._append_fiber_row(fiber_data)
             self.update_preview_plot()
             
             # Clear inputs for next entry
@@ -709,7 +720,7 @@ class FiberSectionCreationDialog(QDialog):
             }
             
             self.patches_data.append(patch_data)
-            self.update_patches_table()
+            self._append_patch_row(patch_data)
             self.update_preview_plot()
             
         except Exception as e:
@@ -741,7 +752,7 @@ class FiberSectionCreationDialog(QDialog):
             }
             
             self.patches_data.append(patch_data)
-            self.update_patches_table()
+            self._append_patch_row(patch_data)
             self.update_preview_plot()
             
         except Exception as e:
@@ -771,7 +782,7 @@ class FiberSectionCreationDialog(QDialog):
             }
             
             self.patches_data.append(patch_data)
-            self.update_patches_table()
+            self._append_patch_row(patch_data)
             self.update_preview_plot()
             
         except Exception as e:
@@ -799,7 +810,7 @@ class FiberSectionCreationDialog(QDialog):
             }
             
             self.layers_data.append(layer_data)
-            self.update_layers_table()
+            self._append_layer_row(layer_data)
             self.update_preview_plot()
             
         except Exception as e:
@@ -828,119 +839,150 @@ class FiberSectionCreationDialog(QDialog):
             }
             
             self.layers_data.append(layer_data)
-            self.update_layers_table()
+            self._append_layer_row(layer_data)
             self.update_preview_plot()
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to add layer: {str(e)}")
 
+    def _append_table_row(self, table, cells, on_delete):
+        """Append one row of ``cells`` followed by a Delete button"""
+        row = table.rowCount()
+        table.insertRow(row)
+        for column, text in enumerate(cells):
+            table.setItem(row, column, QTableWidgetItem(text))
+        
+        # Look the row up when clicked; earlier rows may have been removed since
+        delete_btn = QPushButton("Delete")
+        delete_btn.clicked.connect(
+            lambda checked=False, btn=delete_btn: on_delete(table.indexAt(btn.pos()).row())
+        )
+        table.setCellWidget(row, len(cells), delete_btn)
+
+    def _append_fiber_row(self, fiber_data):
+        """Add one fiber to the fibers table"""
+        self._append_table_row(
+            self.fibers_table,
+            (
+                f"{fiber_data['y_loc']:.4f}",
+                f"{fiber_data['z_loc']:.4f}",
+                f"{fiber_data['area']:.4f}",
+                fiber_data['material'].user_name,
+            ),
+            self.delete_fiber,
+        )
+
+    def _append_patch_row(self, patch_data):
+        """Add one patch to the patches table"""
+        # Create parameter summary
+        if patch_data['type'] == 'Rectangular':
+            params = f"Subdiv: {patch_data['num_subdiv_y']}x{patch_data['num_subdiv_z']}, " \
+                    f"Corners: ({patch_data['y1']:.2f},{patch_data['z1']:.2f}) to " \
+                    f"({patch_data['y2']:.2f},{patch_data['z2']:.2f})"
+        elif patch_data['type'] == 'Quadrilateral':
+            params = f"Subdiv: {patch_data['num_subdiv_y']}x{patch_data['num_subdiv_z']}, " \
+                    f"Vertices: {len(patch_data['vertices'])}"
+        elif patch_data['type'] == 'Circular':
+            params = f"Subdiv: {patch_data['num_subdiv_circ']}x{patch_data['num_subdiv_rad']}, " \
+                    f"Center: ({patch_data['y_center']:.2f},{patch_data['z_center']:.2f}), " \
+                    f"R: {patch_data['inner_radius']:.2f}-{patch_data['outer_radius']:.2f}"
+        
+        self._append_table_row(
+            self.patches_table,
+            (patch_data['type'], patch_data['material'].user_name, params),
+            self.delete_patch,
+        )
+
+    def _append_layer_row(self, layer_data):
+        """Add one layer to the layers table"""
+        # Create parameter summary
+        if layer_data['type'] == 'Straight':
+            params = f"Fibers: {layer_data['num_fibers']}, Area: {layer_data['area_per_fiber']:.4f}, " \
+                    f"From: ({layer_data['y1']:.2f},{layer_data['z1']:.2f}) to " \
+                    f"({layer_data['y2']:.2f},{layer_data['z2']:.2f})"
+        elif layer_data['type'] == 'Circular':
+            params = f"Fibers: {layer_data['num_fibers']}, Area: {layer_data['area_per_fiber']:.4f}, " \
+                    f"Center: ({layer_data['y_center']:.2f},{layer_data['z_center']:.2f}), " \
+                    f"R: {layer_data['radius']:.2f}"
+        
+        self._append_table_row(
+            self.layers_table,
+            (layer_data['type'], layer_data['material'].user_name, params),
+            self.delete_layer,
+        )
+
     def update_fibers_table(self):
-        """Update the fibers table display"""
-        self.fibers_table.setRowCount(len(self.fibers_data))
-        
-        for row, fiber_data in enumerate(self.fibers_data):
-            self.fibers_table.setItem(row, 0, QTableWidgetItem(f"{fiber_data['y_loc']:.4f}"))
-            self.fibers_table.setItem(row, 1, QTableWidgetItem(f"{fiber_data['z_loc']:.4f}"))
-            self.fibers_table.setItem(row, 2, QTableWidgetItem(f"{fiber_data['area']:.4f}"))
-            self.fibers_table.setItem(row, 3, QTableWidgetItem(fiber_data['material'].user_name))
-            
-            # Delete button
-            delete_btn = QPushButton("Delete")
-            delete_btn.clicked.connect(lambda checked, r=row: self.delete_fiber(r))
-            self.fibers_table.setCellWidget(row, 4, delete_btn)
+        """Rebuild the fibers table display"""
+        self.fibers_table.setRowCount(0)
+        for fiber_data in self.fibers_data:
+            self._append_fiber_row(fiber_data)
 
     def update_patches_table(self):
-        """Update the patches table display"""
-        self.patches_table.setRowCount(len(self.patches_data))
-        
-        for row, patch_data in enumerate(self.patches_data):
-            self.patches_table.setItem(row, 0, QTableWidgetItem(patch_data['type']))
-            self.patches_table.setItem(row, 1, QTableWidgetItem(patch_data['material'].user_name))
-            
-            # Create parameter summary
-            if patch_data['type'] == 'Rectangular':
-                params = f"Subdiv: {patch_data['num_subdiv_y']}x{patch_data['num_subdiv_z']}, " \
-                        f"Corners: ({patch_data['y1']:.2f},{patch_data['z1']:.2f}) to " \
-                        f"({patch_data['y2']:.2f},{patch_data['z2']:.2f})"
-            elif patch_data['type'] == 'Quadrilateral':
-                params = f"Subdiv: {patch_data['num_subdiv_y']}x{patch_data['num_subdiv_z']}, " \
-                        f"Vertices: {len(patch_data['vertices'])}"
-            elif patch_data['type'] == 'Circular':
-                params = f"Subdiv: {patch_data['num_subdiv_circ']}x{patch_data['num_subdiv_rad']}, " \
-                        f"Center: ({patch_data['y_center']:.2f},{patch_data['z_center']:.2f}), " \
-                        f"R: {patch_data['inner_radius']:.2f}-{patch_data['outer_radius']:.2f}"
-            
-            self.patches_table.setItem(row, 2, QTableWidgetItem(params))
-            
-            # Delete button
-            delete_btn = QPushButton("Delete")
-            delete_btn.clicked.connect(lambda checked, r=row: self.delete_patch(r))
-            self.patches_table.setCellWidget(row, 3, delete_btn)
+        """Rebuild the patches table display"""
+        self.patches_table.setRowCount(0)
+        for patch_data in self.patches_data:
+            self._append_patch_row(patch_data)
 
     def update_layers_table(self):
-        """Update the layers table display"""
-        self.layers_table.setRowCount(len(self.layers_data))
-        
-        for row, layer_data in enumerate(self.layers_data):
-            self.layers_table.setItem(row, 0, QTableWidgetItem(layer_data['type']))
-            self.layers_table.setItem(row, 1, QTableWidgetItem(layer_data['material'].user_name))
-            
-            # Create parameter summary
-            if layer_data['type'] == 'Straight':
-                params = f"Fibers: {layer_data['num_fibers']}, Area: {layer_data['area_per_fiber']:.4f}, " \
-                        f"From: ({layer_data['y1']:.2f},{layer_data['z1']:.2f}) to " \
-                        f"({layer_data['y2']:.2f},{layer_data['z2']:.2f})"
-            elif layer_data['type'] == 'Circular':
-                params = f"Fibers: {layer_data['num_fibers']}, Area: {layer_data['area_per_fiber']:.4f}, " \
-                        f"Center: ({layer_data['y_center']:.2f},{layer_data['z_center']:.2f}), " \
-                        f"R: {layer_data['radius']:.2f}"
-            
-            self.layers_table.setItem(row, 2, QTableWidgetItem(params))
-            
-            # Delete button
-            delete_btn = QPushButton("Delete")
-            delete_btn.clicked.connect(lambda checked, r=row: self.delete_layer(r))
-            self.layers_table.setCellWidget(row, 3, delete_btn)
+        """Rebuild the layers table display"""
+        self.layers_table.setRowCount(0)
+        for layer_data in self.layers_data:
+            self._append_layer_row(layer_data)
 
     def delete_fiber(self, row):
         """Delete a fiber from the data"""
         if 0 <= row < len(self.fibers_data):
             self.fibers_data.pop(row)
-            self.update_fibers_table()
+            self.fibers_table.removeRow(row)
             self.update_preview_plot()
 
     def delete_patch(self, row):
         """Delete a patch from the data"""
         if 0 <= row < len(self.patches_data):
             self.patches_data.pop(row)
-            self.update_patches_table()
+            self.patches_table.removeRow(row)
             self.update_preview_plot()
 
     def delete_layer(self, row):
         """Delete a layer from the data"""
         if 0 <= row < len(self.layers_data):
             self.layers_data.pop(row)
-            self.update_layers_table()
+            self.layers_table.removeRow(row)
             self.update_preview_plot()
 
     def update_preview_plot(self):
-        """Update the section preview plot"""
+        """Schedule an update of the section preview plot"""
+        self._preview_timer.start()
+
+    def _preview_title(self):
+        return f"Preview: {self.name_input.text() or 'Unnamed Section'}"
+
+    def update_preview_title(self):
+        """Retitle the preview plot without rebuilding its artists"""
+        if self._preview_timer.isActive():
+            # A pending redraw will pick up the new name
+            return
+        self.preview_ax.set_title(self._preview_title())
+        self.canvas.draw_idle()
+
+    def refresh_info_text(self):
+        """Refresh the info text for the components currently shown"""
+        self.update_info_text(*self._preview_components)
+
+    def _redraw_preview_plot(self):
+        """Rebuild the preview components and redraw the section plot"""
         try:
-            # Create temporary component objects for plotting
-            fibers = []
+            # Individual fibers are plotted straight from their data as arrays
+            fiber_yz_area = np.array(
+                [(d['y_loc'], d['z_loc'], d['area']) for d in self.fibers_data],
+                dtype=float,
+            ).reshape(-1, 3)
+            fiber_materials = [d['material'] for d in self.fibers_data]
+            
+            # Create temporary patch and layer objects for plotting
             patches = []
             layers = []
             
-            # Create fiber objects
-            for fiber_data in self.fibers_data:
-                fiber = FiberElement(
-                    fiber_data['y_loc'],
-                    fiber_data['z_loc'],
-                    fiber_data['area'],
-                    fiber_data['material']
-                )
-                fibers.append(fiber)
-            
             # Create patch objects
             for patch_data in self.patches_data:
                 if patch_data['type'] == 'Rectangular':
@@ -1006,35 +1048,37 @@ class FiberSectionCreationDialog(QDialog):
                     )
                     layers.append(layer)
             
-            # Clear and plot
-            self.figure.clear()
-            ax = self.figure.add_subplot(111)
+            # Clear and plot on the persistent preview axes
+            ax = self.preview_ax
+            ax.clear()
             
             # Use static plotting method from FiberSection
-            FiberSection.plot_components(
-                fibers=fibers,
+            FiberSection.plot_from_arrays(
+                fiber_yz_area=fiber_yz_area,
+                fiber_materials=fiber_materials,
                 patches=patches,
                 layers=layers,
                 ax=ax,
-                title=f"Preview: {self.name_input.text() or 'Unnamed Section'}"
+                title=self._preview_title()
             )
             
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
             # Update info text
-            self.update_info_text(fibers, patches, layers)
+            self._preview_components = (fiber_materials, patches, layers)
+            self.update_info_text(fiber_materials, patches, layers)
             
         except Exception as e:
             # Clear plot on error
-            self.figure.clear()
-            ax = self.figure.add_subplot(111)
+            ax = self.preview_ax
+            ax.clear()
             ax.text(0.5, 0.5, f"Plot Error:\n{str(e)}", 
                    ha='center', va='center', transform=ax.transAxes)
-            self.canvas.draw()
+            self.canvas.draw_idle()
 
-    def update_info_text(self, fibers, patches, layers):
+    def update_info_text(self, fiber_materials, patches, layers):
         """Update the section information display"""
-        total_est_fibers = len(fibers)
+        total_est_fibers = len(fiber_materials)
         for patch in patches:
             total_est_fibers += patch.estimate_fiber_count()
         for layer in layers:
@@ -1042,8 +1086,8 @@ class FiberSectionCreationDialog(QDialog):
         
         # Count unique materials
         all_materials = set()
-        for f in fibers:
-            all_materials.add(f.material.user_name)
+        for material in fiber_materials:
+            all_materials.add(material.user_name)
         for p in patches:
             all_materials.add(p.material.user_name)
         for l in layers:
@@ -1051,7 +1095,7 @@ class FiberSectionCreationDialog(QDialog):
         
         info = f"""Section Preview Information:
 
-Individual Fibers: {len(fibers)}
+Individual Fibers: {len(fiber_materials)}
 Patches: {len(patches)}
 Layers: {len(layers)}
 Estimated Total Fibers: {total_est_fibers}
@@ -3,7 +3,7 @@ Isolator2Spring Section GUI Dialogs
 Implements creation and edit dialogs for Isolator2SpringSection
 """
 from qtpy.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QFormLayout
-from femora.components.section.section_opensees import Isolator2SpringSection
+from femora.components.section import Isolator2SpringSection
 
 class Isolator2SpringSectionCreationDialog(QDialog):
     def __init__(self, parent=None):
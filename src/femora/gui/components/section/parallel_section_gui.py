@@ -8,8 +8,8 @@ from qtpy.QtWidgets import (
 )
 from qtpy.QtCore import Qt
 
-from femora.components.section.section_opensees import ParallelSection
-from femora.components.section.section_base import Section
+from femora.components.section import ParallelSection
+from femora.core.section_base import Section
 
 class ParallelSectionCreationDialog(QDialog):
     """
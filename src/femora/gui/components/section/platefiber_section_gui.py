@@ -9,8 +9,8 @@ from qtpy.QtWidgets import (
 )
 from qtpy.QtCore import Qt
 
-from femora.components.section.section_opensees import PlateFiberSection
-from femora.components.section.section_gui_utils import setup_material_dropdown, get_material_by_combo_selection, set_combo_to_material, validate_material_selection
+from femora.components.section import PlateFiberSection
+from femora.gui.components.section.section_gui_utils import setup_material_dropdown, get_material_by_combo_selection, set_combo_to_material, validate_material_selection
 
 class PlateFiberSectionCreationDialog(QDialog):
     """
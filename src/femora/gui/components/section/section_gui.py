@@ -2,31 +2,130 @@
 Main Section GUI Manager
 Uses separate dialog files for each section type
 """
+import importlib
 
 from qtpy.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QComboBox, QPushButton, QTableWidget, QTableWidgetItem, 
+    QComboBox, QPushButton, QTableView, QAbstractItemView,
     QDialog, QMessageBox, QHeaderView, QGridLayout, QMenu
 )
-from qtpy.QtCore import Qt
+from qtpy.QtCore import Qt, QAbstractTableModel, QModelIndex
 
-from femora.components.section.section_base import Section, SectionRegistry, SectionManager
-from femora.components.section.section_opensees import *
+from femora.core.section_base import Section
 
-# Import separate dialog files for each section type
+_DIALOGS = "femora.gui.components.section"
 
-from femora.components.section.elastic_section_gui import ElasticSectionCreationDialog, ElasticSectionEditDialog
-from femora.components.section.wf2d_section_gui import WFSection2dCreationDialog, WFSection2dEditDialog
-from femora.components.section.rc_section_gui import RCSectionCreationDialog, RCSectionEditDialog
-from femora.components.section.wf2d_section_gui import WFSection2dCreationDialog, WFSection2dEditDialog
-from femora.components.section.elastic_membrane_section_gui import ElasticMembranePlateSectionCreationDialog, ElasticMembranePlateSectionEditDialog
-from femora.components.section.platefiber_section_gui import PlateFiberSectionCreationDialog, PlateFiberSectionEditDialog
-from femora.components.section.aggregator_section_gui import AggregatorSectionCreationDialog, AggregatorSectionEditDialog
-from femora.components.section.uniaxial_section_gui import UniaxialSectionCreationDialog, UniaxialSectionEditDialog
-from femora.components.section.parallel_section_gui import ParallelSectionCreationDialog, ParallelSectionEditDialog
-from femora.components.section.bidirectional_section_gui import BidirectionalSectionCreationDialog, BidirectionalSectionEditDialog
-from femora.components.section.isolator2spring_section_gui import Isolator2SpringSectionCreationDialog, Isolator2SpringSectionEditDialog
-from femora.components.section.fiber_section_gui import FiberSectionCreationDialog 
+# Section type -> (module, creation dialog, edit dialog). SectionManagerTab._make_dialog
+# imports a module only when one of its dialogs opens, so opening the tab does not
+# load every one of them.
+# An edit dialog of None means editing is not available for that type yet.
+_SECTION_DIALOGS = {
+    "Elastic": (f"{_DIALOGS}.elastic_section_gui", "ElasticSectionCreationDialog", "ElasticSectionEditDialog"),
+    "WFSection2d": (f"{_DIALOGS}.wf2d_section_gui", "WFSection2dCreationDialog", "WFSection2dEditDialog"),
+    "RC": (f"{_DIALOGS}.rc_section_gui", "RCSectionCreationDialog", "RCSectionEditDialog"),
+    "ElasticMembranePlateSection": (
+        f"{_DIALOGS}.elastic_membrane_section_gui",
+        "ElasticMembranePlateSectionCreationDialog",
+        "ElasticMembranePlateSectionEditDialog",
+    ),
+    "PlateFiber": (f"{_DIALOGS}.platefiber_section_gui", "PlateFiberSectionCreationDialog", "PlateFiberSectionEditDialog"),
+    "Fiber": (f"{_DIALOGS}.fiber_section_gui", "FiberSectionCreationDialog", None),
+    "Aggregator": (f"{_DIALOGS}.aggregator_section_gui", "AggregatorSectionCreationDialog", "AggregatorSectionEditDialog"),
+    "Uniaxial": (f"{_DIALOGS}.uniaxial_section_gui", "UniaxialSectionCreationDialog", "UniaxialSectionEditDialog"),
+    "Parallel": (f"{_DIALOGS}.parallel_section_gui", "ParallelSectionCreationDialog", "ParallelSectionEditDialog"),
+    "Bidirectional": (
+        f"{_DIALOGS}.bidirectional_section_gui",
+        "BidirectionalSectionCreationDialog",
+        "BidirectionalSectionEditDialog",
+    ),
+    "Isolator2spring": (
+        f"{_DIALOGS}.isolator2spring_section_gui",
+        "Isolator2SpringSectionCreationDialog",
+        "Isolator2SpringSectionEditDialog",
+    ),
+}
+
+
+class SectionTableModel(QAbstractTableModel):
+    """Read-only table model over the sections of the current model."""
+
+    _HEADERS = ("Type", "Name")
+    _FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Sections in table order. Rows are keyed by object, not tag, because
+        # removing a section compacts the tags of the ones after it.
+        self._rows = []
+        # Display text per row, built once per change so data() is a lookup.
+        self._cells = []
+        self._row_by_id = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._cells[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return self._FLAGS if index.isValid() else Qt.NoItemFlags
+
+    @staticmethod
+    def _row_cells(section):
+        return (section.section_name, section.user_name)
+
+    def section_at(self, row):
+        """Return the section shown on a table row."""
+        return self._rows[row]
+
+    def append_section(self, section):
+        """Add one row at the end of the table."""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(section)
+        self._cells.append(self._row_cells(section))
+        self._row_by_id[id(section)] = row
+        self.endInsertRows()
+
+    def update_section(self, section):
+        """Re-read the display text of the row showing ``section``, if any."""
+        row = self._row_by_id.get(id(section), -1)
+        if row < 0:
+            return
+        self._cells[row] = self._row_cells(section)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._HEADERS) - 1))
+
+    def remove_section(self, section):
+        """Drop the row showing ``section``, if any."""
+        row = self._row_by_id.pop(id(section), -1)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._cells[row]
+        for key, index in self._row_by_id.items():
+            if index > row:
+                self._row_by_id[key] = index - 1
+        self.endRemoveRows()
+
+    def reload(self):
+        """Re-read the sections from the model manager."""
+        from femora.components.MeshMaker import MeshMaker
+        self.beginResetModel()
+        self._rows = list(MeshMaker.get_instance().section.get_all().values())
+        self._cells = [self._row_cells(section) for section in self._rows]
+        self._row_by_id = {id(section): row for row, section in enumerate(self._rows)}
+        self.endResetModel()
 
 
 class SectionManagerTab(QWidget):
@@ -44,9 +143,8 @@ class SectionManagerTab(QWidget):
         type_layout = QGridLayout()
         
         self.section_type_combo = QComboBox()
-        # Get available section types
-        available_types = SectionRegistry.get_section_types()
-        self.section_type_combo.addItems(available_types)
+        # Offer the section types that have a creation dialog
+        self.section_type_combo.addItems(list(_SECTION_DIALOGS))
         
         create_section_btn = QPushButton("Create New Section")
         create_section_btn.clicked.connect(self.open_section_creation_dialog)
@@ -58,9 +156,9 @@ class SectionManagerTab(QWidget):
         layout.addLayout(type_layout)
         
         # Sections table
-        self.sections_table = QTableWidget()
-        self.sections_table.setColumnCount(2)  # Type, Name (removed Edit, Delete columns)
-        self.sections_table.setHorizontalHeaderLabels(["Type", "Name"])
+        self.sections_model = SectionTableModel(self)
+        self.sections_table = QTableView()
+        self.sections_table.setModel(self.sections_model)
         header = self.sections_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -70,8 +168,8 @@ class SectionManagerTab(QWidget):
         self.sections_table.customContextMenuRequested.connect(self.show_context_menu)
         
         # Select full rows when clicking
-        self.sections_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.sections_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.sections_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.sections_table.setSelectionMode(QAbstractItemView.SingleSelection)
         
         layout.addWidget(self.sections_table)
         
@@ -91,103 +189,62 @@ class SectionManagerTab(QWidget):
         layout.addLayout(button_layout)
         
         # Initial refresh
-        self.refresh_sections_list()    
+        self.refresh_sections_list()
+
+    def _make_dialog(self, section_type, section=None):
+        """
+        Return the creation dialog for ``section_type``, or its edit dialog
+        for ``section``. Tells the user and returns None when unavailable.
+        """
+        location = _SECTION_DIALOGS.get(section_type)
+        if location is None:
+            kind = "edit dialog" if section is not None else "dialog"
+            QMessageBox.warning(self, "Error", f"No {kind} available for section type: {section_type}")
+            return None
+        module_name, creation_name, edit_name = location
+        class_name = creation_name if section is None else edit_name
+        if class_name is None:
+            QMessageBox.information(self, "Not Available", f"{section_type} section editing will be implemented in the future.")
+            return None
+        dialog_class = getattr(importlib.import_module(module_name), class_name)
+        if section is None:
+            return dialog_class(parent=self)
+        return dialog_class(section, self)
+
     def open_section_creation_dialog(self):
         """
         Open the appropriate creation dialog based on section type
         """
-        section_type = self.section_type_combo.currentText()
-        
-        if section_type == "Elastic":
-            dialog = ElasticSectionCreationDialog(self)
-        elif section_type == "WFSection2d":
-            dialog = WFSection2dCreationDialog(self)
-        elif section_type == "RC":
-            dialog = RCSectionCreationDialog(self)
-        elif section_type == "ElasticMembranePlateSection":
-            dialog = ElasticMembranePlateSectionCreationDialog(self)
-        elif section_type == "PlateFiber":
-            dialog = PlateFiberSectionCreationDialog(self)
-        elif section_type == "Fiber":
-            dialog = FiberSectionCreationDialog(parent=self)
-        elif section_type == "Aggregator":
-            dialog = AggregatorSectionCreationDialog(self)
-        elif section_type == "Uniaxial":
-            dialog = UniaxialSectionCreationDialog(self)
-        elif section_type == "Parallel":
-            dialog = ParallelSectionCreationDialog(self)
-        elif section_type == "Bidirectional":
-            dialog = BidirectionalSectionCreationDialog(self)
-        elif section_type == "Isolator2spring":
-            dialog = Isolator2SpringSectionCreationDialog(self)
-        else:
-            QMessageBox.warning(self, "Error", f"No dialog available for section type: {section_type}")
+        dialog = self._make_dialog(self.section_type_combo.currentText())
+        if dialog is None:
             return
         
-        # Execute dialog and refresh if section was created
-        if dialog.exec() == QDialog.Accepted and hasattr(dialog, 'created_section'):
-            self.refresh_sections_list()
+        # Only add a row if a section was actually created
+        if dialog.exec() == QDialog.Accepted and getattr(dialog, 'created_section', None) is not None:
+            self.sections_model.append_section(dialog.created_section)
 
     def open_section_edit_dialog(self, section):
         """
         Open the appropriate edit dialog based on section type
         """
-        section_type = section.section_name
-        
-        if section_type == "Elastic":
-            dialog = ElasticSectionEditDialog(section, self)
-        elif section_type == "WFSection2d":
-            dialog = WFSection2dEditDialog(section, self)
-        elif section_type == "RC":
-            dialog = RCSectionEditDialog(section, self)
-        elif section_type == "ElasticMembranePlateSection":
-            dialog = ElasticMembranePlateSectionEditDialog(section, self)
-        elif section_type == "PlateFiber":
-            dialog = PlateFiberSectionEditDialog(section, self)
-        elif section_type == "Fiber":
-            QMessageBox.information(self, "Not Available", "Fiber section editing will be implemented in the future.")
-            return
-        elif section_type == "Aggregator":
-            dialog = AggregatorSectionEditDialog(section, self)
-        elif section_type == "Uniaxial":
-            dialog = UniaxialSectionEditDialog(section, self)
-        elif section_type == "Parallel":
-            dialog = ParallelSectionEditDialog(section, self)
-        elif section_type == "Bidirectional":
-            dialog = BidirectionalSectionEditDialog(section, self)
-        elif section_type == "Isolator2spring":
-            dialog = Isolator2SpringSectionEditDialog(section, self)
-        else:
-            QMessageBox.warning(self, "Error", f"No edit dialog available for section type: {section_type}")
+        dialog = self._make_dialog(section.section_name, section)
+        if dialog is None:
             return
         
-        # Execute dialog and refresh if changes were made
+        # Only the edited row can change
         if dialog.exec() == QDialog.Accepted:
-            self.refresh_sections_list()
+            self.sections_model.update_section(section)
 
     def refresh_sections_list(self):
         """Update the sections table with current sections"""
-        # Clear existing rows
-        self.sections_table.setRowCount(0)
-        
-        # Get all sections
-        from femora.components.MeshMaker import MeshMaker
-        sections = MeshMaker.get_instance().section.get_all()
-        
-        # Set row count
-        self.sections_table.setRowCount(len(sections))
-        
-        # Populate table
-        for row, (tag, section) in enumerate(sections.items()):
-            # Section Type
-            type_item = QTableWidgetItem(section.section_name)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-            self.sections_table.setItem(row, 0, type_item)
-            
-            # User Name
-            name_item = QTableWidgetItem(section.user_name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.sections_table.setItem(row, 1, name_item)
+        self.sections_model.reload()
+
+    def selected_section(self):
+        """Return the section on the selected row, or ``None``"""
+        index = self.sections_table.currentIndex()
+        if not index.isValid():
+            return None
+        return self.sections_model.section_at(index.row())
 
     def show_context_menu(self, position):
         """Show context menu for sections table"""
@@ -197,23 +254,13 @@ class SectionManagerTab(QWidget):
         
         action = menu.exec_(self.sections_table.viewport().mapToGlobal(position))
         
+        section = self.selected_section()
+        if section is None:
+            return
         if action == edit_action:
-            selected_row = self.sections_table.currentRow()
-            if selected_row != -1:
-                name = self.sections_table.item(selected_row, 1).text()
-                # Find section by user_name
-                from femora.components.MeshMaker import MeshMaker
-                section = MeshMaker.get_instance().section.get(name)
-                if section:
-                    self.open_section_edit_dialog(section)
+            self.open_section_edit_dialog(section)
         elif action == delete_action:
-            selected_row = self.sections_table.currentRow()
-            if selected_row != -1:
-                name = self.sections_table.item(selected_row, 1).text()
-                from femora.components.MeshMaker import MeshMaker
-                section = MeshMaker.get_instance().section.get(name)
-                if section:
-                    self.delete_section(section.tag)
+            self.delete_section(section.tag)
 
     def delete_section(self, tag):
         """Delete a section from the system"""
@@ -230,13 +277,16 @@ class SectionManagerTab(QWidget):
         
         if reply == QMessageBox.Yes:
             MeshMaker.get_instance().section.remove(tag)
-            self.refresh_sections_list()
+            self.sections_model.remove_section(section)
             QMessageBox.information(self, "Success", f"Section '{section.user_name}' deleted successfully.")
 
     def clear_all_sections(self):
         """Clear all sections from the system"""
         from femora.components.MeshMaker import MeshMaker
-        if not MeshMaker.get_instance().section.get_all():
+        manager = MeshMaker.get_instance().section
+        # get_all() copies the registry, so take it once
+        count = len(manager.get_all())
+        if not count:
             QMessageBox.information(self, "No Sections", "There are no sections to clear.")
             return
             
@@ -248,8 +298,7 @@ class SectionManagerTab(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            count = len(MeshMaker.get_instance().section.get_all())
-            MeshMaker.get_instance().section.clear()
+            manager.clear()
             self.refresh_sections_list()
             QMessageBox.information(self, "Success", f"All {count} sections cleared successfully.")
 
@@ -259,8 +308,7 @@ if __name__ == "__main__":
     import sys
     from femora.components.material.uniaxial import ElasticUniaxialMaterial
     from femora.components.material.nd import ElasticIsotropicMaterial
-    from femora.components.section.section_opensees import ElasticSection
-    from femora.components.section.section_opensees import WFSection2d
+    from femora.components.section import ElasticSection, WFSection2d
     
     # Create the Qt Application
     app = QApplication(sys.argv)
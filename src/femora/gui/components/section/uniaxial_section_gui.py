@@ -8,8 +8,8 @@ from qtpy.QtWidgets import (
 )
 from qtpy.QtCore import Qt
 
-from femora.components.section.section_opensees import UniaxialSection
-from femora.components.section.section_gui_utils import setup_material_dropdown, get_material_by_combo_selection, set_combo_to_material
+from femora.components.section import UniaxialSection
+from femora.gui.components.section.section_gui_utils import setup_material_dropdown, get_material_by_combo_selection, set_combo_to_material
 
 RESPONSE_CODES = ['P', 'Mz', 'My', 'Vy', 'Vz', 'T']
 
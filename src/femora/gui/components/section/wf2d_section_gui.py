@@ -10,11 +10,11 @@ from qtpy.QtWidgets import (
 )
 from qtpy.QtCore import Qt
 
-from femora.components.section.section_opensees import WFSection2d
+from femora.components.section import WFSection2d
 from femora.core.material_base import Material
 
 # Import utilities if available
-from femora.components.section.section_gui_utils import (
+from femora.gui.components.section.section_gui_utils import (
     setup_material_dropdown, validate_material_selection,
     get_material_by_combo_selection, set_combo_to_material,
     setup_filtered_material_dropdown
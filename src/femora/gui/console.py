@@ -1,29 +1,64 @@
 from qtconsole.rich_jupyter_widget import RichJupyterWidget
-from qtconsole.inprocess import QtInProcessKernelManager
+from qtpy.QtCore import QTimer
 
 class InteractiveConsole(RichJupyterWidget):
     '''
     A console widget that can execute Python code and display rich output.
+
+    The IPython kernel is started the first time the widget is shown (or
+    used), so building the main window does not pay for it.
     '''
     def __init__(self, parent=None):
         super().__init__(parent)
-        
+        self._kernel_ready = False
+        self._pending_namespace = {}
+
+        # Configure appearance
+        self.syntax_style = 'solarized-dark'
+        self.set_default_style(colors='linux')
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._kernel_ready:
+            QTimer.singleShot(0, self._ensure_kernel)
+
+    def _ensure_kernel(self):
+        '''
+        Start the in-process kernel if it is not running yet.
+        '''
+        if self._kernel_ready:
+            return
+        # Import here: ipykernel is heavy and only needed once the console is used
+        from qtconsole.inprocess import QtInProcessKernelManager
+
         # Create kernel manager and kernel
         kernel_manager = QtInProcessKernelManager()
         kernel_manager.start_kernel()
-        
+
         # Create kernel client
         kernel_client = kernel_manager.client()
         kernel_client.start_channels()
-        
+
         # Set up the console with the kernel
         self.kernel_manager = kernel_manager
         self.kernel_client = kernel_client
-        
-        # Configure appearance
-        self.syntax_style = 'solarized-dark'
-        self.set_default_style(colors='linux')
+        self._kernel_ready = True
+
+        if self._pending_namespace:
+            kernel_manager.kernel.shell.push(self._pending_namespace)
+            self._pending_namespace = {}
+
+    def push(self, namespace):
+        '''
+        Make variables available in the console namespace.
 
+        Args:
+            namespace (dict): Names and values to add to the console.
+        '''
+        if self._kernel_ready:
+            self.kernel_manager.kernel.shell.push(namespace)
+        else:
+            self._pending_namespace.update(namespace)
 
 
     def print(self, message):
@@ -37,4 +72,5 @@ class InteractiveConsole(RichJupyterWidget):
             raise ValueError("The message must be a string.")
         
         # Use the kernel to execute a Python print command
+        self._ensure_kernel()
         self.kernel_client.execute(f'print("{message}")')
\ No newline at end of file
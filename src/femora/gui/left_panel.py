@@ -14,7 +14,7 @@ from femora.gui.components.recorder.recorder_gui import RecorderManagerTab
 from femora.gui.components.analysis.analysis_gui import AnalysisManagerTab
 from femora.gui.components.process.process_gui import ProcessGUI
 from femora.components.DRM.combinedDRMGUI import CombinedDRMGUI
-from femora.components.section.section_gui import SectionManagerTab
+from femora.gui.components.section.section_gui import SectionManagerTab
 from femora.gui.components.interface.interface_gui import InterfaceManagerTab
 
 class LeftPanel(QFrame):
@@ -75,40 +75,18 @@ class LeftPanel(QFrame):
     
 
     def setup_tab_contents(self):
-        # Material and  section tab
-        self.material_tab.layout = QVBoxLayout()
-        self.material_tab.layout.addWidget(MaterialManagerTab())
-        self.material_tab.setLayout(self.material_tab.layout)
-        # Section tab
-        self.material_tab.layout.addWidget(SectionManagerTab())
-        self.material_tab.setLayout(self.material_tab.layout)
-
-        # Mesh tab
-        self.mesh_tab.layout = QVBoxLayout()
-        self.mesh_tab.layout.addWidget(MeshPartManagerTab())
-        self.mesh_tab.setLayout(self.mesh_tab.layout)
-
-        # Interface tab
-        self.interface_tab.layout = QVBoxLayout()
-        self.interface_tab.layout.addWidget(InterfaceManagerTab())
-        self.interface_tab.setLayout(self.interface_tab.layout)
-
-        # Assemble tab
-        self.Assemble_tab.layout = QVBoxLayout()
-        self.Assemble_tab.layout.addWidget(AssemblyManagerTab())
-        self.Assemble_tab.setLayout(self.Assemble_tab.layout)
-
-
-        # DRM tab
-        self.drm_tab.layout = QVBoxLayout()
-        self.drm_tab.layout.addWidget(CombinedDRMGUI())
-        self.drm_tab.setLayout(self.drm_tab.layout)
-
-
-        # # Process tab
-        # self.analysis_tab.layout = QVBoxLayout()
-        # self.analysis_tab.layout.addWidget(ProcessGUI())
-        # self.analysis_tab.setLayout(self.analysis_tab.layout)
+        # Heavy manager tabs are built the first time they are shown
+        self._tab_builders = {
+            self.material_tab: self.build_material_tab,
+            self.mesh_tab: self.build_mesh_tab,
+            self.interface_tab: self.build_interface_tab,
+            self.Assemble_tab: self.build_assemble_tab,
+            self.drm_tab: self.build_drm_tab,
+        }
+        for tab in self._tab_builders:
+            tab.layout = QVBoxLayout()
+            tab.setLayout(tab.layout)
+        self.tabs.currentChanged.connect(self.ensure_tab_built)
 
         # Manage Tab
         self.manage_tab.layout = QVBoxLayout()
@@ -131,6 +109,29 @@ class LeftPanel(QFrame):
         add_manage_button("Manage Analysis", lambda: AnalysisManagerTab(parent=self).show())
         add_manage_button("Manage Process", lambda: ProcessGUI(parent=self).show())
         self.manage_tab.setLayout(self.manage_tab.layout)
-        
 
+        # Build the tab that is visible at startup
+        self.ensure_tab_built(self.tabs.currentIndex())
+
+    def ensure_tab_built(self, index):
+        """Build the contents of the tab at ``index`` if not built yet"""
+        builder = self._tab_builders.pop(self.tabs.widget(index), None)
+        if builder is not None:
+            builder()
+
+    def build_material_tab(self):
+        # Material and section managers
+        self.material_tab.layout.addWidget(MaterialManagerTab())
+        self.material_tab.layout.addWidget(SectionManagerTab())
+
+    def build_mesh_tab(self):
+        self.mesh_tab.layout.addWidget(MeshPartManagerTab())
+
+    def build_interface_tab(self):
+        self.interface_tab.layout.addWidget(InterfaceManagerTab())
 
+    def build_assemble_tab(self):
+        self.Assemble_tab.layout.addWidget(AssemblyManagerTab())
+
+    def build_drm_tab(self):
+        self.drm_tab.layout.addWidget(CombinedDRMGUI())
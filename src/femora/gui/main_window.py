@@ -1,9 +1,7 @@
 from qtpy.QtGui import QAction, QPalette, QColor, QFont
-from qtpy.QtWidgets import (QApplication, QMainWindow, QWidget, QHBoxLayout, QSplitter, QStyleFactory)
+from qtpy.QtWidgets import (QApplication, QMainWindow, QSplitter, QStyleFactory)
 from qtpy.QtCore import Qt
 
-import pyvistaqt
-import pyvista as pv
 from femora.components.MeshMaker import MeshMaker
 from femora.gui.left_panel import LeftPanel
 from femora.gui.console import InteractiveConsole
@@ -13,6 +11,23 @@ from femora.gui.toolbar import ToolbarManager
 from femora.gui.progress_gui import ProgressGUI
 
 
+SIMCENTER_STYLESHEET = """
+    QPushButton {
+        background-color: #64B5F6;
+        color: white;
+        border-radius: 6px;
+        padding: 6px 12px;         /* vertical and horizontal padding */
+        min-height: 28px;          /* prevent buttons from collapsing */
+    }
+    QPushButton:hover {
+        background-color: #42A5F5;
+    }
+    QPushButton:pressed {
+        background-color: #1E88E5;
+    }
+"""
+
+
 class MainWindow(QMainWindow):
     _instance = None  # Class variable to store the single instance
 
@@ -113,11 +128,8 @@ class MainWindow(QMainWindow):
 
 
     def setup_main_layout(self):
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
-        main_layout = QHBoxLayout(main_widget)
         self.main_splitter = QSplitter(Qt.Horizontal)
-        main_layout.addWidget(self.main_splitter)
+        self.setCentralWidget(self.main_splitter)
 
     def setup_panels(self):
         self.left_panel = LeftPanel()
@@ -126,6 +138,9 @@ class MainWindow(QMainWindow):
         self.main_splitter.addWidget(self.right_panel)
 
     def setup_plotter(self):
+        # Import here so importing this module does not load the Qt/VTK interactor
+        import pyvistaqt
+
         self.plotter = pyvistaqt.BackgroundPlotter(show=False)
         self.plotter_widget = self.plotter.app_window
         self.plotter_widget.setMinimumHeight(400)
@@ -135,18 +150,24 @@ class MainWindow(QMainWindow):
         PlotterManager.set_plotter(self.plotter)
 
     def setup_console(self):
+        import pyvista as pv
+
         self.console = InteractiveConsole()
         self.console.setMinimumHeight(200)
         self.right_panel.addWidget(self.console)
         
         # Make plotter available in console namespace
-        self.console.kernel_manager.kernel.shell.push({
+        self.console.push({
             'plotter': self.plotter,
             'pv': pv,
             'meshMaker': self.meshMaker,
         })
 
     def setup_splitters(self):
+        # Resize children once on release instead of on every drag step,
+        # so the plotter is not re-rendered while a handle is dragged
+        self.main_splitter.setOpaqueResize(False)
+        self.right_panel.setOpaqueResize(False)
         self.main_splitter.setSizes([300, 1100])  # Left panel : Right panel ratio
         self.right_panel.setSizes([600, 200])     # Plotter : Console ratio
 
@@ -154,7 +175,9 @@ class MainWindow(QMainWindow):
     def update_font_and_resize(self):
         font = QFont('Segoe UI', self.font_size)
         QApplication.setFont(font)
-        self.apply_theme()
+        # Style, palette and stylesheet don't depend on the font size, so
+        # only the console font needs refreshing here
+        self.apply_console_font()
         self.update()
 
 
@@ -263,21 +286,10 @@ class MainWindow(QMainWindow):
             self.console.set_default_style(colors='lightbg')
             self.console.syntax_style = 'default'
             self.plotter.set_background('white')
-            QApplication.instance().setStyleSheet("""
-                QPushButton {
-                    background-color: #64B5F6;
-                    color: white;
-                    border-radius: 6px;
-                    padding: 6px 12px;         /* vertical and horizontal padding */
-                    min-height: 28px;          /* prevent buttons from collapsing */
-                }
-                QPushButton:hover {
-                    background-color: #42A5F5;
-                }
-                QPushButton:pressed {
-                    background-color: #1E88E5;
-                }
-            """)
+            app = QApplication.instance()
+            # Re-setting an identical stylesheet still re-polishes every widget
+            if app.styleSheet() != SIMCENTER_STYLESHEET:
+                app.setStyleSheet(SIMCENTER_STYLESHEET)
         else:
             QApplication.setPalette(self.light_palette)
             self.plotter.set_background('#52576eff')
@@ -285,9 +297,11 @@ class MainWindow(QMainWindow):
             # self.console.syntax_style = 'default'
             # self.plotter.set_background('white')
         
-        # Update font
-        console_font = QFont('Menlo', self.font_size)
-        self.console.font = console_font
+        self.apply_console_font()
+
+    def apply_console_font(self):
+        """Match the console font to the current font size"""
+        self.console.font = QFont('Menlo', self.font_size)
     
     def increase_font_size(self):
         self.font_size += 1
@@ -21,10 +21,12 @@ from femora.core.material_base import Material
 
 # Mock material with specific class name required by PML3DElement
 class ElasticIsotropicMaterial(Material):
+    material_type = "nDMaterial"
+    material_name = "ElasticIsotropic"
+
     def __init__(self, tag: int):
-        super().__init__("nDMaterial", f"Mat{tag}", f"UserMat{tag}")
+        super().__init__(f"UserMat{tag}")
         self.tag = tag
-        self._material_type = "nDMaterial"
 
     def to_tcl(self) -> str:
         return f"material {self.tag}"
@@ -38,10 +40,12 @@ class ElasticIsotropicMaterial(Material):
         return []
 
 class OtherMaterial(Material):
+    material_type = "nDMaterial"
+    material_name = "Other"
+
     def __init__(self, tag: int):
-        super().__init__("nDMaterial", f"Mat{tag}", f"UserMat{tag}")
+        super().__init__(f"UserMat{tag}")
         self.tag = tag
-        self._material_type = "nDMaterial"
 
     def to_tcl(self) -> str:
         return f"material {self.tag}"
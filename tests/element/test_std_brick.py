@@ -21,9 +21,9 @@ from femora.core.material_base import Material
 
 class DummyMaterial(Material):
     def __init__(self, tag: int, mat_type: str):
-        super().__init__(mat_type, f"DummyMat{tag}", f"UserDummyMat{tag}")
+        super().__init__(f"UserDummyMat{tag}")
         self.tag = tag
-        self._material_type = mat_type
+        self.material_type = mat_type
 
 
     def to_tcl(self) -> str:
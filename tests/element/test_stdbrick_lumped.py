@@ -11,8 +11,11 @@ from femora.components.element.std_brick import stdBrickElement
 
 
 class DummyNDMaterial(Material):
+    material_type = 'nDMaterial'
+    material_name = 'DummyND'
+
     def __init__(self, user_name="dummyND"):
-        super().__init__(material_type='nDMaterial', material_name='DummyND', user_name=user_name)
+        super().__init__(user_name=user_name)
         self.tag = 1  # manually assign for element-level tests
 
     @classmethod
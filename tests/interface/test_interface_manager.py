@@ -545,9 +545,14 @@ def test_pre_assemble_clears_manager_owned_embeddedinfo_list(mesh_maker):
         EmbeddedInfo(beams=(1,), core_number=0, beams_solids=[([1], [2])])
     )
 
+    mesh_maker.interface._solid_search_contexts[None] = (None, None)
+    mesh_maker.interface._meshpart_cell_index = (None, None, None)
+
     iface._on_pre_assemble()
 
     assert mesh_maker.interface._embeddedinfo_list == []
+    assert mesh_maker.interface._solid_search_contexts == {}
+    assert mesh_maker.interface._meshpart_cell_index is None
     assert iface._instance_embeddedinfo_list == []
 
 
@@ -565,3 +570,85 @@ def test_clear_clears_manager_owned_embeddedinfo_list(mesh_maker):
     mesh_maker.interface.clear()
 
     assert mesh_maker.interface._embeddedinfo_list == []
+
+
+def test_points_inside_solid_includes_cell_faces():
+    grid = pv.ImageData(dimensions=(3, 2, 2)).cast_to_unstructured_grid()
+    solid = grid.extract_cells([0])
+    points = np.array(
+        [[0.5, 0.5, 0.5], [1.0, 0.5, 0.5], [1.5, 0.5, 0.5], [0.5, 0.5, 2.0]],
+        dtype=float,
+    )
+
+    inside = EmbeddedBeamSolidInterface._points_inside_solid(solid, points)
+
+    assert inside.tolist() == [True, True, False, False]
+
+
+def test_resolve_beam_solid_conflicts_merges_duplicate_and_overlapping_infos(mesh_maker):
+    _make_line_mesh(mesh_maker)
+    iface = mesh_maker.interface.beam_solid_interface(
+        name="pile_ifc",
+        beam_part="beam_mesh",
+        radius=0.5,
+    )
+    mesh = pv.ImageData(dimensions=(7, 2, 2)).cast_to_unstructured_grid()
+    mesh.cell_data["Core"] = np.array([0, 1, 2, 3, 4, 5], dtype=np.int32)
+    first = EmbeddedInfo(beams=(0,), core_number=2, beams_solids=[([0], [1, 2])])
+    overlapping = EmbeddedInfo(beams=(3,), core_number=1, beams_solids=[([3], [2, 4])])
+    unrelated = EmbeddedInfo(beams=(5,), core_number=5, beams_solids=[([5], [5])])
+    infos = [first, overlapping, first, unrelated]
+    mesh_maker.interface._embeddedinfo_list.extend(infos)
+    iface._instance_embeddedinfo_list.extend(infos)
+
+    mesh_maker.interface._resolve_beam_solid_conflicts(assembled_mesh=mesh)
+
+    assert mesh.cell_data["Core"].tolist() == [1, 1, 1, 1, 1, 5]
+    assert [info.core_number for info in mesh_maker.interface._embeddedinfo_list] == [1, 1, 1, 5]
+    assert [info.core_number for info in iface._instance_embeddedinfo_list] == [1, 1, 1, 5]
+
+
+def test_resolve_beam_solid_conflicts_rejects_same_beams_on_different_cores(mesh_maker):
+    _make_line_mesh(mesh_maker)
+    mesh_maker.interface.beam_solid_interface(
+        name="pile_ifc",
+        beam_part="beam_mesh",
+        radius=0.5,
+    )
+    mesh = pv.ImageData(dimensions=(4, 2, 2)).cast_to_unstructured_grid()
+    mesh.cell_data["Core"] = np.array([0, 1, 2], dtype=np.int32)
+    mesh_maker.interface._embeddedinfo_list.extend(
+        [
+            EmbeddedInfo(beams=(0,), core_number=0, beams_solids=[([0], [1])]),
+            EmbeddedInfo(beams=(0,), core_number=2, beams_solids=[([0], [2])]),
+        ]
+    )
+
+    with pytest.raises(ValueError, match="conflict"):
+        mesh_maker.interface._resolve_beam_solid_conflicts(assembled_mesh=mesh)
+
+
+def test_beam_solid_interfaces_share_solid_search_context(mesh_maker):
+    _make_line_mesh(mesh_maker)
+    _make_structured_line_mesh(mesh_maker)
+    first = mesh_maker.interface.beam_solid_interface(name="ifc_a", beam_part="beam_mesh", radius=0.5)
+    second = mesh_maker.interface.beam_solid_interface(name="ifc_b", beam_part="struct_beam", radius=0.5)
+    mesh = pv.ImageData(dimensions=(3, 3, 3)).cast_to_unstructured_grid()
+
+    context = first._build_selected_solid_search_context(mesh)
+
+    np.testing.assert_array_equal(context.cell_mask, first._solid_part_cell_mask(mesh))
+    assert second._build_selected_solid_search_context(mesh) is context
+    assert second._build_selected_solid_search_context(mesh.copy()) is not context
+
+
+def test_meshpart_cell_ids_match_full_scan(mesh_maker):
+    _make_line_mesh(mesh_maker)
+    iface = mesh_maker.interface.beam_solid_interface(name="ifc", beam_part="beam_mesh", radius=0.5)
+    mesh = pv.ImageData(dimensions=(4, 4, 4)).cast_to_unstructured_grid()
+    tags = np.array([3, 1, 2] * 9)
+    mesh.cell_data["MeshPartTag_celldata"] = tags
+
+    for tag in (1, 2, 3, 4):
+        np.testing.assert_array_equal(iface._meshpart_cell_ids(mesh, tag), np.where(tags == tag)[0])
+    assert mesh_maker.interface._meshpart_cell_index[0] is mesh
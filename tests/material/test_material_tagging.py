@@ -20,8 +20,11 @@ from femora.core.material_base import Material
 class DummyMaterial(Material):
     """Minimal concrete material for tagging tests."""
 
+    material_type = "uniaxialMaterial"
+    material_name = "Dummy"
+
     def __init__(self, user_name: str):
-        super().__init__("uniaxialMaterial", "Dummy", user_name)
+        super().__init__(user_name)
 
     def to_tcl(self) -> str:
         return f"# dummy material {self._require_tag()} {self.user_name}"
@@ -239,3 +242,103 @@ def test_namespaced_material_factories(manager):
 def test_namespaced_material_factories_accept_name_alias(manager):
     material = manager.nd.elastic_isotropic(name="soil", E=30e6, nu=0.3, rho=2000.0)
     assert material.user_name == "soil"
+
+
+def test_get_by_name_after_retagging(manager):
+    m1 = manager.add(DummyMaterial("mat1"))
+    m2 = manager.add(DummyMaterial("mat2"))
+    m3 = manager.add(DummyMaterial("mat3"))
+    manager.remove(m1.tag)
+    manager.set_tag_start(10)
+    assert manager.get_by_name("mat1") is None
+    assert manager.get_by_name("mat2") is m2
+    assert manager.get_by_name("mat3") is m3
+    assert manager.get(m2.tag) is m2
+    assert m3.tag == 11
+
+
+def test_add_many_assigns_contiguous_tags(manager):
+    existing = manager.add(DummyMaterial("mat0"))
+    batch = manager.add_many(DummyMaterial(f"bulk{i}") for i in range(5))
+    assert existing.tag == 1
+    assert [m.tag for m in batch] == [2, 3, 4, 5, 6]
+    assert all(m._owner is manager for m in batch)
+    assert manager.get_by_name("bulk4") is batch[4]
+    assert manager.add(DummyMaterial("after")).tag == 7
+
+
+def test_add_many_fills_gaps_around_preassigned_tags(manager):
+    fixed = DummyMaterial("fixed")
+    fixed.tag = 2
+    batch = manager.add_many([DummyMaterial("a"), fixed, DummyMaterial("b")])
+    assert [m.tag for m in batch] == [1, 2, 3]
+
+
+def test_add_many_is_atomic_on_duplicate_name(manager):
+    manager.add(DummyMaterial("mat1"))
+    with pytest.raises(ValueError, match="user_name 'mat1' already exists"):
+        manager.add_many([DummyMaterial("new"), DummyMaterial("mat1")])
+    with pytest.raises(ValueError, match="user_name 'dup' already exists"):
+        manager.add_many([DummyMaterial("dup"), DummyMaterial("dup")])
+    assert len(manager) == 1
+    assert manager.get_by_name("new") is None
+
+
+def test_param_values_follow_fixed_parameter_order(manager):
+    soil = manager.nd.elastic_isotropic(user_name="soil", E=30e6, nu=0.3, rho=2000.0)
+    values = soil.param_values()
+    assert values.dtype.name == "float64"
+    assert values.tolist() == [30e6, 0.3, 2000.0]
+    assert soil.to_tcl() == "nDMaterial ElasticIsotropic 1 30000000.0 0.3 2000.0; # soil"
+
+
+def test_material_labels_are_class_constants(manager):
+    a = manager.nd.elastic_isotropic(user_name="a", E=1.0, nu=0.2)
+    b = manager.nd.elastic_isotropic(user_name="b", E=2.0, nu=0.2)
+    assert a.material_type is b.material_type == "nDMaterial"
+    assert type(a)._tcl_prefix == "nDMaterial ElasticIsotropic"
+    dummy = DummyMaterial("legacy")
+    assert (dummy.material_type, dummy.material_name) == ("uniaxialMaterial", "Dummy")
+
+
+def test_get_values_skips_unset_parameters(manager):
+    steel = manager.uniaxial.steel01(user_name="steel", Fy=355.0, E0=200000.0, b=0.01)
+    assert steel.get_values(["Fy", "b", "a1"]) == {"Fy": 355.0, "b": 0.01}
+
+
+def test_failed_add_leaves_material_unmanaged(manager):
+    m1 = manager.add(DummyMaterial("mat1"))
+    clash = DummyMaterial("clash")
+    clash.tag = m1.tag
+    with pytest.raises(ValueError, match="tag 1 already exists"):
+        manager.add(clash)
+    assert clash._owner is None
+    assert manager.get_by_name("clash") is None
+    assert manager.add(m1) is m1
+    assert len(manager) == 1
+
+
+def test_factory_rejects_duplicate_name_before_validation(manager):
+    manager.nd.elastic_isotropic(user_name="soil", E=30e6, nu=0.3)
+    with pytest.raises(ValueError, match="user_name 'soil' already exists"):
+        manager.nd.elastic_isotropic(user_name="soil", E=-1.0, nu=0.3)
+    with pytest.raises(ValueError, match="user_name 'soil' already exists"):
+        manager.uniaxial.steel01(user_name="soil")
+
+
+def test_next_available_tags_skips_taken_and_ignores_out_of_window_tags():
+    from femora.core.tagging import CompactRetagPolicy
+
+    store = {3: object(), 5: object(), 1: object(), 500: object()}
+    tags = CompactRetagPolicy.next_available_tags(store, 2, 4)
+    assert tags.tolist() == [2, 4, 6, 7]
+    assert CompactRetagPolicy.next_available_tags({}, 10, 0).tolist() == []
+
+
+def test_get_parameters_returns_shared_class_tuple():
+    from femora.components.material import ElasticIsotropicMaterial, Steel01Material
+
+    params = ElasticIsotropicMaterial.get_parameters()
+    assert params == ("E", "nu", "rho")
+    assert ElasticIsotropicMaterial.get_parameters() is params
+    assert Steel01Material.get_parameters() == ()
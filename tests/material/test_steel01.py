@@ -101,3 +101,22 @@ def test_sequential_tagging(manager):
     m2 = manager.add(Steel01Material(user_name="S2", Fy=420.0, E0=210000.0, b=0.02))
     assert m1.tag == 1
     assert m2.tag == 2
+
+
+def test_steel01_tcl_follows_retag_and_params_reassignment(manager):
+    m1 = manager.add(Steel01Material(user_name="S1", Fy=355.0, E0=200000.0, b=0.01))
+    m2 = manager.add(Steel01Material(user_name="S2", Fy=420.0, E0=210000.0, b=0.02))
+    assert m2.to_tcl() == "uniaxialMaterial Steel01 2 420.0 210000.0 0.02; # S2"
+    manager.remove(m1.tag)
+    assert m2.to_tcl() == "uniaxialMaterial Steel01 1 420.0 210000.0 0.02; # S2"
+    m2.params = {"Fy": 500.0, "E0": 210000.0, "b": 0.03}
+    assert m2.to_tcl() == "uniaxialMaterial Steel01 1 500.0 210000.0 0.03; # S2"
+
+
+def test_steel01_params_are_read_only_and_updates_reach_tcl(manager):
+    mat = manager.add(Steel01Material(user_name="S1", Fy=355.0, E0=200000.0, b=0.01))
+    assert mat.to_tcl() == f"uniaxialMaterial Steel01 {mat.tag} 355.0 200000.0 0.01; # S1"
+    with pytest.raises(TypeError):
+        mat.params["Fy"] = 400.0
+    mat.params = {**mat.params, "Fy": 400.0}
+    assert mat.to_tcl() == f"uniaxialMaterial Steel01 {mat.tag} 400.0 200000.0 0.01; # S1"
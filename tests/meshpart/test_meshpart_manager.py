@@ -176,3 +176,33 @@ def test_uniform_rectangular_grid_rejects_legacy_names(mesh_maker):
                 "Nz Cells": 1,
             },
         )
+
+
+def test_duplicate_meshpart_name_leaves_manager_unchanged(mesh_maker):
+    mat = mesh_maker.material.add(ElasticIsotropicMaterial(user_name="m3", E=1.0, nu=0.3, rho=0.0))
+    ele = mesh_maker.element.brick.std(ndof=3, material=mat)
+    from femora.components.mesh.volume_meshparts import StructuredRectangular3D
+
+    def make(name):
+        return StructuredRectangular3D(
+            user_name=name,
+            element=ele,
+            x_min=0,
+            x_max=1,
+            y_min=0,
+            y_max=1,
+            z_min=0,
+            z_max=1,
+            nx=1,
+            ny=1,
+            nz=1,
+        )
+
+    first = mesh_maker.meshpart.add(make("block"))
+    duplicate = make("block")
+    with pytest.raises(ValueError, match="already in use"):
+        mesh_maker.meshpart.add(duplicate)
+    assert duplicate._owner is None
+    assert duplicate.region is None
+    assert mesh_maker.meshpart.get("block") is first
+    assert mesh_maker.meshpart.add(first) is first
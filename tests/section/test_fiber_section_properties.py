@@ -0,0 +1,68 @@
+# =============================================================================
+# Femora: Fast Efficient Meta-modeling for OpenSees-based Resilience Analysis
+# Copyright 2026 Amin Pakzad and Pedro Arduino
+# Developed at the UW Geotechnical Lab
+# SPDX-License-Identifier: Apache-2.0
+# =============================================================================
+
+import math
+
+import pytest
+
+import femora.components.section.fiber  # noqa: F401
+from femora.core.model import Model
+
+
+def _rounded(points):
+    return sorted((round(y, 9), round(z, 9), round(a, 9)) for a, y, z in points)
+
+
+@pytest.fixture
+def model():
+    mm = Model()
+    mm.clear_model()
+    return mm
+
+
+@pytest.fixture
+def concrete(model):
+    return model.material.uniaxial.elastic(user_name="Concrete", E=3600.0)
+
+
+def test_rectangular_patch_properties(model, concrete):
+    sec = model.section.fiber.section(user_name="Rect")
+    sec.add_rectangular_patch(material=concrete, num_subdiv_y=4, num_subdiv_z=6, y1=-1, z1=-2, y2=1, z2=2)
+    assert sec.get_area() == pytest.approx(8.0)
+    # Midpoint integration of y^2 over n cells of width h: b*h^3/12 * (1 - 1/n^2)
+    assert sec.get_Iy() == pytest.approx(2 * 4**3 / 12 * (1 - 1 / 36))
+    assert sec.get_Iz() == pytest.approx(4 * 2**3 / 12 * (1 - 1 / 16))
+
+
+def test_quadrilateral_patch_matches_rectangular_patch(model, concrete):
+    rect = model.section.fiber.section(user_name="Rect")
+    rect.add_rectangular_patch(material=concrete, num_subdiv_y=3, num_subdiv_z=5, y1=0, z1=0, y2=3, z2=2)
+    quad = model.section.fiber.section(user_name="Quad")
+    quad.add_quadrilateral_patch(
+        material=concrete, num_subdiv_ij=3, num_subdiv_jk=5,
+        vertices=[(0, 0), (3, 0), (3, 2), (0, 2)],
+    )
+    assert _rounded(quad._discretize_to_fibers()) == _rounded(rect._discretize_to_fibers())
+
+
+def test_circular_patch_and_layer_properties(model, concrete):
+    sec = model.section.fiber.section(user_name="Circle")
+    sec.add_circular_patch(material=concrete, num_subdiv_circ=16, num_subdiv_rad=4,
+                           y_center=0, z_center=0, int_rad=0, ext_rad=2)
+    assert sec.get_area() == pytest.approx(math.pi * 4)
+    assert len(sec._discretize_to_fibers()) == 64
+
+    sec.add_straight_layer(material=concrete, num_fibers=4, area_per_fiber=0.5, y1=0, z1=-1, y2=0, z2=1)
+    assert sec.get_area() == pytest.approx(math.pi * 4 + 2.0)
+    assert sec.get_Iy() == pytest.approx(sec.get_Iz() + 0.5 * 2 * (0.75**2 + 0.25**2))
+
+
+def test_empty_section_properties(model):
+    sec = model.section.fiber.section(user_name="Empty")
+    assert sec.get_area() == 0.0
+    assert sec.get_Iy() == 0.0
+    assert sec.get_Iz() == 0.0
@@ -0,0 +1,26 @@
+# =============================================================================
+# Femora: Fast Efficient Meta-modeling for OpenSees-based Resilience Analysis
+# Copyright 2026 Amin Pakzad and Pedro Arduino
+# Developed at the UW Geotechnical Lab
+# SPDX-License-Identifier: Apache-2.0
+# =============================================================================
+
+import importlib
+import importlib.util
+
+import pytest
+
+pytest.importorskip("qtpy.QtWidgets")
+pytest.importorskip("matplotlib")
+
+from femora.gui.components.section.section_gui import _SECTION_DIALOGS
+
+
+@pytest.mark.parametrize("section_type", sorted(_SECTION_DIALOGS))
+def test_section_dialog_entries_resolve(section_type):
+    module_name, creation_name, edit_name = _SECTION_DIALOGS[section_type]
+    assert importlib.util.find_spec(module_name) is not None
+    module = importlib.import_module(module_name)
+    assert getattr(module, creation_name, None) is not None
+    if edit_name is not None:
+        assert getattr(module, edit_name, None) is not None